@@ -112,7 +112,7 @@ async def register(
         
         logger.info(f"New user registered: {user.email}")
         
-        return UserResponse.model_validate(user)
+        return UserResponse.from_orm_trusted(user)
         
     except HTTPException:
         raise
@@ -137,11 +137,12 @@ async def login(
     
     try:
         # Get user by email or username
-        user = await User.get_by_email(db, request.email)
+        user = await User.get_by_email(db, input_sanitizer.sanitize_email(request.email))
         if not user:
             user = await User.get_by_username(db, request.email)  # Allow login with username
         
         if not user:
+            password_manager.verify_password(request.password, password_manager.dummy_hash)
             raise HTTPException(
                 status_code=status.HTTP_401_UNAUTHORIZED,
                 detail="Invalid credentials"
@@ -195,7 +196,7 @@ async def login(
         logger.info(f"User logged in: {user.email}")
         
         return LoginResponse(
-            user=UserResponse.model_validate(user),
+            user=UserResponse.from_orm_trusted(user),
             **tokens,
             session_id=session_id
         )
@@ -317,7 +318,7 @@ async def get_current_user_info(
     current_user: User = Depends(get_current_user)
 ):
     """Get current user information."""
-    return UserResponse.model_validate(current_user)
+    return UserResponse.from_orm_trusted(current_user)
 
 
 @router.post("/password/reset-request")
@@ -536,7 +537,7 @@ if settings.feature_oauth_login:
             logger.info(f"OAuth login successful for {provider}: {email}")
             
             return LoginResponse(
-                user=UserResponse.model_validate(user),
+                user=UserResponse.from_orm_trusted(user),
                 **tokens
             )
             
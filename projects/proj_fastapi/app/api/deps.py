@@ -1,8 +1,9 @@
 """FastAPI dependencies for authentication, database, and other common needs."""
 
+import time
 from typing import AsyncGenerator, Optional
 
-from fastapi import Depends, HTTPException, status
+from fastapi import Depends, HTTPException, Request, status
 from fastapi.security import HTTPAuthorizationCredentials, HTTPBearer
 from sqlalchemy.ext.asyncio import AsyncSession
 
@@ -176,7 +177,7 @@ class RateLimiter:
     
     async def __call__(
         self,
-        request,
+        request: Request,
         redis_client = Depends(get_redis_client)
     ):
         """Rate limit based on IP address."""
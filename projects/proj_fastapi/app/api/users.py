@@ -14,6 +14,7 @@ from app.api.deps import (
     require_admin
 )
 from app.core.observability import get_logger
+from app.core.responses import PydanticJSONResponse
 from app.core.security import input_sanitizer, password_manager, password_validator
 from app.models.user import User
 from app.schemas.user import (
@@ -27,6 +28,18 @@ from app.schemas.user import (
 logger = get_logger("users")
 router = APIRouter()
 
+# Free-text profile columns a user may set on their own account
+_PROFILE_TEXT_FIELDS = ("bio", "location", "website", "avatar_url")
+
+
+def _profile_text_updates(sent: dict) -> dict:
+    """Sanitized values for the profile text fields the client sent; null or blank clears one."""
+    return {
+        key: input_sanitizer.sanitize_text(sent[key] or "") or None
+        for key in _PROFILE_TEXT_FIELDS
+        if key in sent
+    }
+
 
 @router.get(
     "/",
@@ -62,13 +75,14 @@ async def get_users(
             **filters
         )
         
-        return UserListResponse(
-            users=[UserResponse.model_validate(user) for user in users],
+        # Returned as a response so the model is written to JSON by pydantic-core directly,
+        # instead of being re-validated and dumped through the response_model
+        return PydanticJSONResponse(UserListResponse(
+            users=[UserResponse.from_orm_trusted(user) for user in users],
             total=total,
             page=offset // limit + 1,
-            size=limit,
-            pages=(total + limit - 1) // limit
-        )
+            size=limit
+        ))
         
     except Exception as e:
         logger.error(f"Get users error: {e}")
@@ -139,7 +153,7 @@ async def create_user(
         
         logger.info(f"User created by admin {current_user.id}: {user.email}")
         
-        return UserResponse.model_validate(user)
+        return UserResponse.from_orm_trusted(user)
         
     except HTTPException:
         raise
@@ -178,7 +192,7 @@ async def get_user(
                 detail="User not found"
             )
         
-        return UserResponse.model_validate(user)
+        return UserResponse.from_orm_trusted(user)
         
     except HTTPException:
         raise
@@ -218,16 +232,19 @@ async def update_user(
                 detail="Not enough permissions"
             )
         
-        # Prepare update data
-        update_data = {}
+        # Only the keys the client actually sent; an explicit null clears a nullable column
+        # and is ignored for the ones that cannot be empty
+        sent = user_data.model_dump(exclude_unset=True)
         
         # Fields that users can update themselves
-        if user_data.full_name is not None:
-            update_data['full_name'] = user_data.full_name
+        update_data = {}
+        if "full_name" in sent:
+            update_data['full_name'] = sent["full_name"]
+        update_data.update(_profile_text_updates(sent))
         
-        if user_data.username is not None:
+        if sent.get("username") is not None:
             # Check username availability
-            username = input_sanitizer.sanitize_username(user_data.username)
+            username = input_sanitizer.sanitize_username(sent["username"])
             existing = await User.get_by_username(db, username)
             if existing and existing.id != user_id:
                 raise HTTPException(
@@ -238,9 +255,9 @@ async def update_user(
         
         # Admin-only fields
         if is_admin:
-            if user_data.email is not None:
+            if sent.get("email") is not None:
                 # Check email availability
-                email = input_sanitizer.sanitize_email(user_data.email)
+                email = input_sanitizer.sanitize_email(sent["email"])
                 existing = await User.get_by_email(db, email)
                 if existing and existing.id != user_id:
                     raise HTTPException(
@@ -249,43 +266,43 @@ async def update_user(
                     )
                 update_data['email'] = email
             
-            if user_data.is_active is not None:
+            if sent.get("is_active") is not None:
                 # Prevent admin from deactivating themselves
-                if user_id == current_user.id and not user_data.is_active:
+                if user_id == current_user.id and not sent["is_active"]:
                     raise HTTPException(
                         status_code=status.HTTP_400_BAD_REQUEST,
                         detail="Cannot deactivate your own account"
                     )
-                update_data['is_active'] = user_data.is_active
+                update_data['is_active'] = sent["is_active"]
             
-            if user_data.is_superuser is not None:
+            if sent.get("is_superuser") is not None:
                 # Prevent admin from removing their own superuser status
-                if user_id == current_user.id and not user_data.is_superuser:
+                if user_id == current_user.id and not sent["is_superuser"]:
                     raise HTTPException(
                         status_code=status.HTTP_400_BAD_REQUEST,
                         detail="Cannot remove your own superuser status"
                     )
-                update_data['is_superuser'] = user_data.is_superuser
+                update_data['is_superuser'] = sent["is_superuser"]
             
-            if user_data.email_verified is not None:
-                update_data['email_verified'] = user_data.email_verified
+            if sent.get("email_verified") is not None:
+                update_data['email_verified'] = sent["email_verified"]
         
         # Password update (users can update their own password)
-        if user_data.password is not None:
+        if sent.get("password") is not None:
             if not is_self and not is_admin:
                 raise HTTPException(
                     status_code=status.HTTP_403_FORBIDDEN,
                     detail="Cannot change other user's password"
                 )
             
-            is_valid, errors = password_validator.validate(user_data.password)
+            is_valid, errors = password_validator.validate(sent["password"])
             if not is_valid:
                 raise HTTPException(
                     status_code=status.HTTP_400_BAD_REQUEST,
                     detail={"message": "Password does not meet requirements", "errors": errors}
                 )
             
-            update_data['hashed_password'] = password_manager.hash_password(user_data.password)
+            update_data['hashed_password'] = password_manager.hash_password(sent["password"])
         
         # Update user
         if update_data:
@@ -293,7 +310,7 @@ async def update_user(
         
         logger.info(f"User {user_id} updated by user {current_user.id}")
         
-        return UserResponse.model_validate(user)
+        return UserResponse.from_orm_trusted(user)
         
     except HTTPException:
         raise
@@ -351,13 +368,14 @@ async def update_profile(
     """Update current user's profile."""
     
     try:
+        sent = profile_data.model_dump(exclude_unset=True)
         update_data = {}
+        if "full_name" in sent:
+            update_data['full_name'] = sent["full_name"]
+        update_data.update(_profile_text_updates(sent))
         
-        if profile_data.full_name is not None:
-            update_data['full_name'] = profile_data.full_name
-        
-        if profile_data.username is not None:
-            username = input_sanitizer.sanitize_username(profile_data.username)
+        if sent.get("username") is not None:
+            username = input_sanitizer.sanitize_username(sent["username"])
             existing = await User.get_by_username(db, username)
             if existing and existing.id != current_user.id:
                 raise HTTPException(
@@ -371,7 +389,7 @@ async def update_profile(
         
         logger.info(f"Profile updated by user {current_user.id}")
         
-        return UserResponse.model_validate(current_user)
+        return UserResponse.from_orm_trusted(current_user)
         
     except HTTPException:
         raise
@@ -403,7 +421,7 @@ async def activate_user(
         
         logger.info(f"User {user_id} activated by admin {current_user.id}")
         
-        return UserResponse.model_validate(user)
+        return UserResponse.from_orm_trusted(user)
         
     except HTTPException:
         raise
@@ -442,7 +460,7 @@ async def deactivate_user(
         
         logger.info(f"User {user_id} deactivated by admin {current_user.id}")
         
-        return UserResponse.model_validate(user)
+        return UserResponse.from_orm_trusted(user)
         
     except HTTPException:
         raise
@@ -2,9 +2,10 @@
 
 import json
 import logging
-from typing import Dict, List, Optional, Set
+from typing import Dict, Iterable, List, Optional, Set
 from datetime import datetime
 
+import orjson
 from fastapi import APIRouter, Depends, WebSocket, WebSocketDisconnect, WebSocketException, status
 from sqlalchemy.ext.asyncio import AsyncSession
 
@@ -18,6 +19,16 @@ from app.models.user import User
 logger = get_logger("websocket")
 router = APIRouter()
 
+def encode_frame(message: dict) -> str:
+    """Encode ``message`` as JSON text with orjson rather than the stdlib."""
+    return orjson.dumps(message).decode()
+
+
+async def send_json_frame(websocket: WebSocket, message: dict):
+    """Send ``message`` as a JSON text frame."""
+    await websocket.send_text(encode_frame(message))
+
+
 # Connection manager for WebSocket connections
 class ConnectionManager:
     """Manage WebSocket connections."""
@@ -89,7 +100,7 @@ class ConnectionManager:
     async def send_personal_message(self, message: dict, websocket: WebSocket):
         """Send message to specific WebSocket connection."""
         try:
-            await websocket.send_json(message)
+            await send_json_frame(websocket, message)
             
             # Update last activity
             if websocket in self.connection_metadata:
@@ -101,6 +112,16 @@ class ConnectionManager:
     
     async def broadcast_to_user(self, user_id: int, message: dict, exclude_websocket: Optional[WebSocket] = None):
         """Send message to all connections of a specific user."""
+        await self._send_frame_to_user(user_id, encode_frame(message), exclude_websocket)
+    
+    async def broadcast_to_users(self, user_ids: Iterable[int], message: dict):
+        """Send message to all connections of each user, encoding it only once."""
+        frame = encode_frame(message)
+        for user_id in user_ids:
+            await self._send_frame_to_user(user_id, frame)
+    
+    async def _send_frame_to_user(self, user_id: int, frame: str, exclude_websocket: Optional[WebSocket] = None):
+        """Send an already-encoded frame to all connections of a user."""
         if user_id not in self.active_connections:
             return
         
@@ -111,7 +132,7 @@ class ConnectionManager:
                 continue
             
             try:
-                await websocket.send_json(message)
+                await websocket.send_text(frame)
                 
                 # Update last activity
                 if websocket in self.connection_metadata:
@@ -129,11 +150,15 @@ class ConnectionManager:
         """Broadcast message to all active connections."""
         exclude_users = exclude_users or set()
         
-        for user_id in list(self.active_connections.keys()):
-            if user_id in exclude_users:
-                continue
-            
-            await self.broadcast_to_user(user_id, message)
+        await self.broadcast_to_users(
+            [user_id for user_id in self.active_connections if user_id not in exclude_users],
+            message,
+        )
+    
+    def clear(self):
+        """Drop every registered connection without notifying anyone."""
+        self.active_connections.clear()
+        self.connection_metadata.clear()
     
     def get_active_users(self) -> List[int]:
         """Get list of active user IDs."""
@@ -181,16 +206,18 @@ async def authenticate_websocket(websocket: WebSocket, token: Optional[str] = No
         # In a real implementation, you'd get the user from the database
         # For now, we'll create a minimal user object
         class MockUser:
-            def __init__(self, id: int, email: str, username: str):
+            def __init__(self, id: int, email: str, username: str, is_superuser: bool):
                 self.id = id
                 self.email = email
                 self.username = username
+                self.is_superuser = is_superuser
                 self.is_active = True
         
         return MockUser(
             id=user_id,
             email=payload.get("email", ""),
-            username=payload.get("username", "")
+            username=payload.get("username", ""),
+            is_superuser=payload.get("is_superuser", False) is True
         )
         
     except Exception as e:
@@ -242,7 +269,7 @@ async def websocket_endpoint(
         # Message handling loop
         while True:
             # Receive message from client
-            data = await websocket.receive_json()
+            data = orjson.loads(await websocket.receive_text())
             
             # Validate message format
             if not isinstance(data, dict) or "type" not in data:
@@ -440,12 +467,9 @@ async def send_room_message(user, room: str, message: str):
             "timestamp": datetime.utcnow().isoformat()
         }
         
-        for member_id_str in member_ids:
-            try:
-                member_id = int(member_id_str)
-                await manager.broadcast_to_user(member_id, room_message)
-            except ValueError:
-                continue
+        await manager.broadcast_to_users(
+            [int(member_id) for member_id in member_ids if member_id.isdigit()], room_message
+        )
         
         logger.info(f"Room message sent to {room} by user {user.id}")
         
@@ -1,8 +1,10 @@
 """JWT Authentication and OAuth2 implementation using Authlib."""
 
+import hashlib
 import logging
+import time
 from datetime import datetime, timedelta, timezone
-from typing import Any, Dict, Optional, Union
+from typing import Any, Dict, Optional, Tuple, Union
 
 from authlib.integrations.starlette_client import OAuth
 from authlib.jose import JsonWebToken, JWTClaims
@@ -45,9 +47,15 @@ if settings.github_client_id and settings.github_client_secret:
 class JWTTokenManager:
     """JWT token creation and validation manager."""
     
+    # Verified payloads are reused for a short while so a token presented on
+    # every request is only decoded and signature-checked once.
+    verify_cache_size = 10_000
+    verify_cache_ttl = 30.0
+    
     def __init__(self) -> None:
         self.jwt_handler = JsonWebToken(['HS256'])
         self.security = HTTPBearer()
+        self._verified: Dict[bytes, Tuple[float, Dict[str, Any]]] = {}
     
     def create_access_token(
         self,
@@ -131,6 +139,26 @@ class JWTTokenManager:
     
     def verify_token(self, token: str) -> Optional[Dict[str, Any]]:
         """Verify and decode JWT token."""
+        key = hashlib.blake2b(token.encode(), digest_size=16).digest()
+        now = time.time()
+        cached = self._verified.get(key)
+        if cached is not None:
+            cached_until, payload = cached
+            if now < cached_until and payload["exp"] > now:
+                return dict(payload)
+            self._verified.pop(key, None)
+        
+        payload = self._decode_token(token)
+        if payload is not None:
+            # Failures are never cached; successes live no longer than the token itself
+            if len(self._verified) >= self.verify_cache_size:
+                self._verified.pop(next(iter(self._verified)))
+            self._verified[key] = (min(now + self.verify_cache_ttl, payload["exp"]), payload)
+            return dict(payload)
+        return None
+    
+    def _decode_token(self, token: str) -> Optional[Dict[str, Any]]:
+        """Decode JWT token and check its signature and expiration."""
         try:
             payload = jwt.decode(
                 token,
@@ -1,3 +1,5 @@
+from functools import cached_property
+
 from pydantic_settings import BaseSettings
 from pydantic import AnyUrl, field_validator
 from typing import List, Union
@@ -14,14 +16,37 @@ class Settings(BaseSettings):
     jwt_secret: str = "default-jwt-secret"  # Will be overridden by env
     cors_origins: str = "http://localhost:3000"
     
+    database_url_sync: str | None = None  # Optional sync driver URL for Alembic
+    
     # Model config for Pydantic v2
     model_config = {"env_file": ".env"}
     
+    # Token settings
+    algorithm: str = "HS256"
+    access_token_expire_minutes: int = 30
+    refresh_token_expire_days: int = 7
+    password_reset_token_expire_hours: int = 1
+    
+    # OAuth providers; a provider is only registered when both values are set
+    google_client_id: str | None = None
+    google_client_secret: str | None = None
+    github_client_id: str | None = None
+    github_client_secret: str | None = None
+    
+    # Redis settings
+    redis_pool_size: int = 20
+    redis_session_expire: int = 86400  # Seconds
+    cache_namespace: str = "fanz"
+    cache_ttl: int = 300  # Seconds
+    
     # Server settings
     host: str = "0.0.0.0"
     port: int = 8080
     api_v1_prefix: str = "/api"
     feature_websocket: bool = True
+    feature_user_registration: bool = True
+    feature_email_verification: bool = False
+    feature_oauth_login: bool = True
     
     # Observability settings
     otel_environment: str = "development"
@@ -38,10 +63,20 @@ class Settings(BaseSettings):
     debug: bool = False
     testing: bool = False
     
+    # Password hashing (Argon2id); tests lower these to keep hashing cheap
+    argon2_time_cost: int = 3         # Number of iterations
+    argon2_memory_cost: int = 65536   # KiB (64 MB)
+    argon2_parallelism: int = 1       # Number of parallel threads
+    
     @property
     def is_production(self) -> bool:
         return self.app_env.lower() in ["production", "prod"]
     
+    @property
+    def secret_key(self) -> str:
+        # Tokens are signed with JWT_SECRET, so there is a single secret to configure
+        return self.jwt_secret
+    
     @property
     def database_url_str(self) -> str:
         return str(self.database_url)
@@ -50,7 +85,7 @@ class Settings(BaseSettings):
     def redis_url_str(self) -> str | None:
         return str(self.redis_url) if self.redis_url else None
 
-    @property
+    @cached_property
     def cors_list(self) -> List[str]:
         return [x.strip() for x in self.cors_origins.split(",") if x.strip()]
 
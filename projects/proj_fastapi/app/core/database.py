@@ -1,5 +1,6 @@
 """Database configuration and session management using async SQLAlchemy 2.0."""
 
+import asyncio
 import logging
 from typing import AsyncGenerator, Optional
 from contextlib import asynccontextmanager
@@ -30,12 +31,20 @@ class DatabaseManager:
     def __init__(self) -> None:
         self.engine: Optional[AsyncEngine] = None
         self.session_factory: Optional[async_sessionmaker[AsyncSession]] = None
+        self._init_lock = asyncio.Lock()
         
     async def initialize(self) -> None:
         """Initialize database engine and session factory."""
         if self.engine is not None:
             return
-            
+        
+        # Double-checked so concurrent startup paths build a single engine/pool
+        async with self._init_lock:
+            if self.engine is None:
+                self._create_engine()
+    
+    def _create_engine(self) -> None:
+        """Create the engine, listeners and session factory."""
         # Database URL
         database_url = settings.database_url_str
         logger.info(f"Connecting to database: {database_url.split('@')[0]}@***")
@@ -0,0 +1,66 @@
+"""Helpers for Alembic data migrations that touch large tables.
+
+Usage inside a migration's ``upgrade()``::
+
+    from alembic import op
+    from app.core.db_migrate_helpers import batch_commit, page_size, paginated
+
+    def upgrade():
+        conn = op.get_bind()
+        query = sa.select(users.c.id, users.c.email)
+        for rows in paginated(conn, query, users.c.id, page_size()):
+            with batch_commit(op.get_context()):
+                conn.execute(users.update(), [...])
+
+Each page is its own keyset query, so no cursor is held open across the commits.
+"""
+
+from contextlib import contextmanager
+from typing import Iterator, Sequence
+
+from sqlalchemy import ColumnElement, Row, Select
+from sqlalchemy.engine import Connection
+
+DEFAULT_PAGE_SIZE = 100
+
+
+def page_size(default: int = DEFAULT_PAGE_SIZE) -> int:
+    """Page size passed to the migration run as ``-x page_size=N``."""
+    from alembic import context
+
+    value = context.get_x_argument(as_dictionary=True).get("page_size")
+    return int(value) if value else default
+
+
+def paginated(
+    connection: Connection,
+    query: Select,
+    key: ColumnElement,
+    size: int = DEFAULT_PAGE_SIZE,
+) -> Iterator[Sequence[Row]]:
+    """Page through ``query`` in chunks of ``size`` rows, keyed on the unique column ``key``.
+
+    Every page is a separate ``WHERE key > :last ORDER BY key LIMIT :size`` query that is
+    fully fetched before it is yielded, so the caller may commit between pages. ``key``
+    must be among the selected columns, and ``query`` must not order or limit itself.
+    """
+    last = None
+    while True:
+        page = query if last is None else query.where(key > last)
+        rows = connection.execute(page.order_by(key).limit(size)).all()
+        if not rows:
+            return
+        yield rows
+        if len(rows) < size:
+            return
+        last = rows[-1]._mapping[key]
+
+
+@contextmanager
+def batch_commit(ctx) -> Iterator[None]:
+    """Commit the enclosed writes on their own, outside the migration's transaction.
+
+    ``ctx`` is the Alembic ``MigrationContext`` (``op.get_context()``).
+    """
+    with ctx.autocommit_block():
+        yield
@@ -1,8 +1,9 @@
 """Observability setup with OpenTelemetry and Prometheus metrics."""
 
+import functools
 import logging
 import time
-from typing import Optional
+from typing import Any, Awaitable, Callable, Optional, TypeVar
 
 from fastapi import Request, Response
 from loguru import logger
@@ -286,6 +287,32 @@ class DatabaseMetricsCollector:
         ACTIVE_CONNECTIONS.observe(size)
 
 
+T = TypeVar("T")
+
+
+def db_op(
+    operation: str, table: str
+) -> Callable[[Callable[..., Awaitable[T]]], Callable[..., Awaitable[T]]]:
+    """Decorate an async database call to record its outcome in DATABASE_OPERATIONS."""
+    success = DATABASE_OPERATIONS.labels(operation=operation, table=table, status="success")
+    error = DATABASE_OPERATIONS.labels(operation=operation, table=table, status="error")
+    
+    def decorator(func: Callable[..., Awaitable[T]]) -> Callable[..., Awaitable[T]]:
+        @functools.wraps(func)
+        async def wrapper(*args: Any, **kwargs: Any) -> T:
+            try:
+                result = await func(*args, **kwargs)
+            except Exception:
+                error.inc()
+                raise
+            success.inc()
+            return result
+        
+        return wrapper
+    
+    return decorator
+
+
 class RedisMetricsCollector:
     """Collect Redis-related metrics."""
     
@@ -294,6 +294,7 @@ class RedisManager:
             local window = tonumber(ARGV[1])
             local limit = tonumber(ARGV[2])
             local now = tonumber(ARGV[3])
+            local member = ARGV[4]
             
             -- Remove old entries
             redis.call('ZREMRANGEBYSCORE', key, 0, now - window)
@@ -303,7 +304,7 @@ class RedisManager:
             
             if current < limit then
                 -- Add current request
-                redis.call('ZADD', key, now, now)
+                redis.call('ZADD', key, now, member)
                 redis.call('EXPIRE', key, window)
                 return {1, limit - current - 1, now + window}
             else
@@ -312,14 +313,17 @@ class RedisManager:
             """
             
             import time
+            import uuid
             now = int(time.time())
+            # Unique member per request; scoring by the second alone would collapse a burst to one entry
             result = await self.redis_client.eval(
                 lua_script,
                 1,
                 rate_key,
                 window,
                 limit,
-                now
+                now,
+                uuid.uuid4().hex
             )
             
             return bool(result[0]), result[1], result[2]
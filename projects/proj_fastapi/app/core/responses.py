@@ -0,0 +1,18 @@
+"""Response classes."""
+
+from typing import Any
+
+from fastapi.responses import ORJSONResponse
+from pydantic import BaseModel
+
+
+class PydanticJSONResponse(ORJSONResponse):
+    """JSON response that serializes Pydantic models straight to bytes in pydantic-core.
+
+    Anything else (dicts, lists, already-encoded response_model output) goes through orjson.
+    """
+
+    def render(self, content: Any) -> bytes:
+        if isinstance(content, BaseModel):
+            return content.__pydantic_serializer__.to_json(content)
+        return super().render(content)
@@ -1,30 +1,61 @@
 """Security utilities for password hashing and validation."""
 
+import hashlib
+import hmac
 import logging
 import secrets
 import string
-from typing import Optional
+import unicodedata
+from functools import cached_property
+from typing import TYPE_CHECKING, Optional
 
-from argon2 import PasswordHasher, exceptions
-from argon2.low_level import Type
+if TYPE_CHECKING:
+    from argon2 import PasswordHasher
 
 logger = logging.getLogger(__name__)
 
+# Throwaway key for the timing pad on malformed hashes
+_DUMMY_HMAC_KEY = secrets.token_bytes(32)
+
+
+def _dummy_hmac(plain_password: str, hashed_password: str) -> None:
+    """Spend a comparable prologue on rejected input so the fast path is not a timing oracle."""
+    hmac.new(
+        _DUMMY_HMAC_KEY,
+        plain_password.encode() + hashed_password.encode(),
+        hashlib.sha256,
+    ).digest()
+
 
 class PasswordManager:
     """Password hashing and verification using Argon2."""
     
-    def __init__(self) -> None:
-        # Argon2 configuration for production security
-        self.hasher = PasswordHasher(
-            time_cost=3,        # Number of iterations
-            memory_cost=65536,  # 64 MB memory usage
-            parallelism=1,      # Number of parallel threads
+    @cached_property
+    def hasher(self) -> "PasswordHasher":
+        """Argon2 hasher, built on first use so importing this module stays cheap."""
+        from argon2 import PasswordHasher
+        from argon2.low_level import Type
+        
+        from app.core.config import settings
+        
+        # Argon2 cost parameters come from settings; defaults are production strength
+        return PasswordHasher(
+            time_cost=settings.argon2_time_cost,
+            memory_cost=settings.argon2_memory_cost,
+            parallelism=settings.argon2_parallelism,
             hash_len=32,        # Length of hash in bytes
             salt_len=16,        # Length of salt in bytes
             type=Type.ID,       # Argon2id variant (recommended)
         )
     
+    @cached_property
+    def dummy_hash(self) -> str:
+        """Hash verified against when a login targets an unknown account.
+        
+        Keeps that path as costly as a wrong password for an existing user.
+        """
+        return self.hash_password(secrets.token_urlsafe(16))
+    
     def hash_password(self, password: str) -> str:
         """Hash a password using Argon2."""
         try:
@@ -35,6 +66,17 @@ class PasswordManager:
     
     def verify_password(self, plain_password: str, hashed_password: str) -> bool:
         """Verify a password against its hash."""
+        # Anything that is not an Argon2 PHC string can never match; skip the memory-hard fill
+        if (
+            not hashed_password
+            or not hashed_password.startswith("$argon2")
+            or hashed_password.count("$") not in (4, 5)
+        ):
+            _dummy_hmac(plain_password, hashed_password or "")
+            return False
+        
+        from argon2 import exceptions
+        
         try:
             self.hasher.verify(hashed_password, plain_password)
             return True
@@ -82,14 +124,16 @@ class PasswordValidator:
         Validate password strength.
         Returns (is_valid, errors)
         """
+        # Reject oversized input before scanning it
+        if len(password) > self.max_length:
+            return False, [f"Password must not exceed {self.max_length} characters"]
+        
         errors = []
         
         # Length checks
         if len(password) < self.min_length:
             errors.append(f"Password must be at least {self.min_length} characters long")
-        
-        if len(password) > self.max_length:
-            errors.append(f"Password must not exceed {self.max_length} characters")
+            return False, errors
         
         # Character type checks
         if self.require_uppercase and not any(c.isupper() for c in password):
@@ -239,6 +283,16 @@ class InputSanitizer:
         
         return sanitized
     
+    @staticmethod
+    def sanitize_text(text: str) -> str:
+        """Sanitize free-form profile text."""
+        # Drop control characters other than newlines and tabs, then trim
+        cleaned = ''.join(
+            c for c in text if c in '\n\t' or unicodedata.category(c) != 'Cc'
+        )
+        
+        return cleaned.strip()
+    
     @staticmethod
     def sanitize_filename(filename: str) -> str:
         """Sanitize filename to prevent path traversal."""
@@ -270,4 +324,4 @@ password_manager = PasswordManager()
 password_validator = PasswordValidator()
 token_generator = TokenGenerator()
 security_headers = SecurityHeaders()
-input_sanitizer = InputSanitizer()
\ No newline at end of file
+input_sanitizer = InputSanitizer()
@@ -1,32 +1,64 @@
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.openapi.utils import get_openapi
 from starlette.responses import Response
 from loguru import logger
 
+from app.api import auth as api_auth, users as api_users, websocket as api_websocket
 from app.core.config import settings
+from app.core.responses import PydanticJSONResponse
 from app.routers import health, auth, users, realtime
+from app.schemas._examples import apply_examples
 
-app = FastAPI(title="FANZ FastAPI", version="0.1.0")
-
-app.add_middleware(
-    CORSMiddleware,
-    allow_origins=settings.cors_list,
-    allow_credentials=True,
-    allow_methods=["*"],
-    allow_headers=["*"],
-)
-
-app.include_router(health.router, prefix="/api")
-app.include_router(auth.router, prefix="/api")
-app.include_router(users.router, prefix="/api")
-app.include_router(realtime.router, prefix="/api")
-
-@app.middleware("http")
-async def add_security_headers(request, call_next):
-    resp: Response = await call_next(request)
-    resp.headers["X-Content-Type-Options"] = "nosniff"
-    resp.headers["X-Frame-Options"] = "DENY"
-    resp.headers["Referrer-Policy"] = "no-referrer"
-    return resp
-
-logger.info("Booting FANZ FastAPI in {} mode", settings.app_env)
\ No newline at end of file
+API_V1_PREFIX = "/api/v1"
+
+
+def create_app() -> FastAPI:
+    """Build the application; tests call this to get an instance of their own."""
+    app = FastAPI(
+        title="FANZ FastAPI",
+        version="0.1.0",
+        default_response_class=PydanticJSONResponse,
+    )
+
+    app.add_middleware(
+        CORSMiddleware,
+        allow_origins=settings.cors_list,
+        allow_credentials=True,
+        allow_methods=["*"],
+        allow_headers=["*"],
+    )
+
+    app.include_router(health.router, prefix="/api")
+    app.include_router(auth.router, prefix="/api")
+    app.include_router(users.router, prefix="/api")
+    app.include_router(realtime.router, prefix="/api")
+
+    app.include_router(api_auth.router, prefix=f"{API_V1_PREFIX}/auth", tags=["auth"])
+    app.include_router(api_users.router, prefix=f"{API_V1_PREFIX}/users", tags=["users"])
+    app.include_router(api_websocket.router, prefix=f"{API_V1_PREFIX}/ws", tags=["websocket"])
+
+    def custom_openapi():
+        # Examples live outside the models; attach them once when the document is first built
+        if app.openapi_schema is None:
+            app.openapi_schema = apply_examples(
+                get_openapi(title=app.title, version=app.version, routes=app.routes)
+            )
+        return app.openapi_schema
+
+    app.openapi = custom_openapi
+
+    @app.middleware("http")
+    async def add_security_headers(request, call_next):
+        resp: Response = await call_next(request)
+        resp.headers["X-Content-Type-Options"] = "nosniff"
+        resp.headers["X-Frame-Options"] = "DENY"
+        resp.headers["Referrer-Policy"] = "no-referrer"
+        return resp
+
+    return app
+
+
+app = create_app()
+
+logger.info("Booting FANZ FastAPI in {} mode", settings.app_env)
@@ -1,7 +1,7 @@
 """User SQLAlchemy model with comprehensive CRUD operations."""
 
 from datetime import datetime
-from typing import Any, Dict, List, Optional, Tuple
+from typing import List, Optional, Tuple
 
 from sqlalchemy import Boolean, DateTime, String, Text, func
 from sqlalchemy.ext.asyncio import AsyncSession
@@ -9,7 +9,7 @@ from sqlalchemy.future import select
 from sqlalchemy.orm import Mapped, mapped_column
 
 from app.core.database import Base
-from app.core.observability import db_metrics
+from app.core.observability import db_op
 
 
 class User(Base):
@@ -64,29 +64,10 @@ class User(Base):
         """String representation of User."""
         return f"<User(id={self.id}, email='{self.email}', username='{self.username}')>"
     
-    def to_dict(self) -> Dict[str, Any]:
-        """Convert user to dictionary."""
-        return {
-            "id": self.id,
-            "email": self.email,
-            "username": self.username,
-            "full_name": self.full_name,
-            "is_active": self.is_active,
-            "is_superuser": self.is_superuser,
-            "email_verified": self.email_verified,
-            "oauth_provider": self.oauth_provider,
-            "avatar_url": self.avatar_url,
-            "bio": self.bio,
-            "location": self.location,
-            "website": self.website,
-            "created_at": self.created_at.isoformat() if self.created_at else None,
-            "updated_at": self.updated_at.isoformat() if self.updated_at else None,
-            "last_login_at": self.last_login_at.isoformat() if self.last_login_at else None,
-        }
-    
     # CRUD Operations
     
     @classmethod
+    @db_op("CREATE", "users")
     async def create(cls, db: AsyncSession, **kwargs) -> "User":
         """Create a new user."""
         try:
@@ -94,58 +75,35 @@ class User(Base):
             db.add(user)
             await db.commit()
             await db.refresh(user)
-            
-            db_metrics.record_operation("CREATE", "users", True)
             return user
             
-        except Exception as e:
+        except Exception:
             await db.rollback()
-            db_metrics.record_operation("CREATE", "users", False)
-            raise e
+            raise
     
     @classmethod
+    @db_op("SELECT", "users")
     async def get(cls, db: AsyncSession, user_id: int) -> Optional["User"]:
         """Get user by ID."""
-        try:
-            result = await db.execute(select(cls).where(cls.id == user_id))
-            user = result.scalar_one_or_none()
-            
-            db_metrics.record_operation("SELECT", "users", True)
-            return user
-            
-        except Exception as e:
-            db_metrics.record_operation("SELECT", "users", False)
-            raise e
+        result = await db.execute(select(cls).where(cls.id == user_id))
+        return result.scalar_one_or_none()
     
     @classmethod
+    @db_op("SELECT", "users")
     async def get_by_email(cls, db: AsyncSession, email: str) -> Optional["User"]:
         """Get user by email address."""
-        try:
-            result = await db.execute(select(cls).where(cls.email == email))
-            user = result.scalar_one_or_none()
-            
-            db_metrics.record_operation("SELECT", "users", True)
-            return user
-            
-        except Exception as e:
-            db_metrics.record_operation("SELECT", "users", False)
-            raise e
+        result = await db.execute(select(cls).where(cls.email == email))
+        return result.scalar_one_or_none()
     
     @classmethod
+    @db_op("SELECT", "users")
     async def get_by_username(cls, db: AsyncSession, username: str) -> Optional["User"]:
         """Get user by username."""
-        try:
-            result = await db.execute(select(cls).where(cls.username == username))
-            user = result.scalar_one_or_none()
-            
-            db_metrics.record_operation("SELECT", "users", True)
-            return user
-            
-        except Exception as e:
-            db_metrics.record_operation("SELECT", "users", False)
-            raise e
+        result = await db.execute(select(cls).where(cls.username == username))
+        return result.scalar_one_or_none()
     
     @classmethod
+    @db_op("SELECT", "users")
     async def get_by_oauth(
         cls, 
         db: AsyncSession, 
@@ -153,23 +111,16 @@ class User(Base):
         oauth_id: str
     ) -> Optional["User"]:
         """Get user by OAuth provider and ID."""
-        try:
-            result = await db.execute(
-                select(cls).where(
-                    cls.oauth_provider == provider,
-                    cls.oauth_id == oauth_id
-                )
+        result = await db.execute(
+            select(cls).where(
+                cls.oauth_provider == provider,
+                cls.oauth_id == oauth_id
             )
-            user = result.scalar_one_or_none()
-            
-            db_metrics.record_operation("SELECT", "users", True)
-            return user
-            
-        except Exception as e:
-            db_metrics.record_operation("SELECT", "users", False)
-            raise e
+        )
+        return result.scalar_one_or_none()
     
     @classmethod
+    @db_op("SELECT", "users")
     async def get_multi(
         cls,
         db: AsyncSession,
@@ -180,45 +131,40 @@ class User(Base):
         **filters
     ) -> Tuple[List["User"], int]:
         """Get multiple users with pagination and filtering."""
-        try:
-            # Build base query
-            query = select(cls)
-            count_query = select(func.count(cls.id))
-            
-            # Apply search filter
-            if search:
-                search_filter = cls.email.ilike(f"%{search}%") | cls.username.ilike(f"%{search}%")
-                if "full_name" in search:
-                    search_filter |= cls.full_name.ilike(f"%{search}%")
-                
-                query = query.where(search_filter)
-                count_query = count_query.where(search_filter)
-            
-            # Apply additional filters
-            for key, value in filters.items():
-                if hasattr(cls, key) and value is not None:
-                    attr = getattr(cls, key)
-                    query = query.where(attr == value)
-                    count_query = count_query.where(attr == value)
+        # Build base query
+        query = select(cls)
+        count_query = select(func.count(cls.id))
+        
+        # Apply search filter
+        if search:
+            search_filter = cls.email.ilike(f"%{search}%") | cls.username.ilike(f"%{search}%")
+            if "full_name" in search:
+                search_filter |= cls.full_name.ilike(f"%{search}%")
             
-            # Get total count
-            count_result = await db.execute(count_query)
-            total = count_result.scalar()
-            
-            # Apply pagination and ordering
-            query = query.order_by(cls.created_at.desc()).offset(offset).limit(limit)
-            
-            # Execute query
-            result = await db.execute(query)
-            users = result.scalars().all()
-            
-            db_metrics.record_operation("SELECT", "users", True)
-            return list(users), total
-            
-        except Exception as e:
-            db_metrics.record_operation("SELECT", "users", False)
-            raise e
+            query = query.where(search_filter)
+            count_query = count_query.where(search_filter)
+        
+        # Apply additional filters
+        for key, value in filters.items():
+            if hasattr(cls, key) and value is not None:
+                attr = getattr(cls, key)
+                query = query.where(attr == value)
+                count_query = count_query.where(attr == value)
+        
+        # Get total count
+        count_result = await db.execute(count_query)
+        total = count_result.scalar()
+        
+        # Apply pagination and ordering
+        query = query.order_by(cls.created_at.desc()).offset(offset).limit(limit)
+        
+        # Execute query
+        result = await db.execute(query)
+        users = result.scalars().all()
+        
+        return list(users), total
     
+    @db_op("UPDATE", "users")
     async def update(self, db: AsyncSession, **kwargs) -> "User":
         """Update user with provided data."""
         try:
@@ -228,69 +174,62 @@ class User(Base):
             
             await db.commit()
             await db.refresh(self)
-            
-            db_metrics.record_operation("UPDATE", "users", True)
             return self
             
-        except Exception as e:
+        except Exception:
             await db.rollback()
-            db_metrics.record_operation("UPDATE", "users", False)
-            raise e
+            raise
     
+    @db_op("DELETE", "users")
     async def delete(self, db: AsyncSession) -> bool:
         """Delete user."""
         try:
             await db.delete(self)
             await db.commit()
-            
-            db_metrics.record_operation("DELETE", "users", True)
             return True
             
-        except Exception as e:
+        except Exception:
             await db.rollback()
-            db_metrics.record_operation("DELETE", "users", False)
-            raise e
+            raise
     
     async def soft_delete(self, db: AsyncSession) -> "User":
         """Soft delete user by setting is_active to False."""
         return await self.update(db, is_active=False)
     
     @classmethod
+    @db_op("SELECT", "users")
     async def get_active_users_count(cls, db: AsyncSession) -> int:
         """Get count of active users."""
-        try:
-            result = await db.execute(
-                select(func.count(cls.id)).where(cls.is_active == True)
-            )
-            count = result.scalar()
-            
-            db_metrics.record_operation("SELECT", "users", True)
-            return count or 0
-            
-        except Exception as e:
-            db_metrics.record_operation("SELECT", "users", False)
-            raise e
+        result = await db.execute(
+            select(func.count(cls.id)).where(cls.is_active == True)
+        )
+        count = result.scalar()
+        return count or 0
     
     @classmethod
+    @db_op("SELECT", "users")
     async def get_superusers(cls, db: AsyncSession) -> List["User"]:
         """Get all superusers."""
-        try:
-            result = await db.execute(
-                select(cls).where(
-                    cls.is_superuser == True,
-                    cls.is_active == True
-                )
+        result = await db.execute(
+            select(cls).where(
+                cls.is_superuser == True,
+                cls.is_active == True
             )
-            users = result.scalars().all()
-            
-            db_metrics.record_operation("SELECT", "users", True)
-            return list(users)
-            
-        except Exception as e:
-            db_metrics.record_operation("SELECT", "users", False)
-            raise e
+        )
+        users = result.scalars().all()
+        return list(users)
     
     @classmethod
+    @db_op("SELECT", "users")
+    async def any_superuser_exists(cls, db: AsyncSession) -> bool:
+        """Check whether at least one superuser exists."""
+        user_id = await db.scalar(
+            select(cls.id).where(cls.is_superuser == True).limit(1)
+        )
+        return user_id is not None
+    
+    @classmethod
+    @db_op("SELECT", "users")
     async def search_users(
         cls,
         db: AsyncSession,
@@ -298,27 +237,20 @@ class User(Base):
         limit: int = 10
     ) -> List["User"]:
         """Search users by email, username, or full name."""
-        try:
-            search_filter = (
-                cls.email.ilike(f"%{query}%") |
-                cls.username.ilike(f"%{query}%") |
-                cls.full_name.ilike(f"%{query}%")
-            )
-            
-            result = await db.execute(
-                select(cls)
-                .where(search_filter, cls.is_active == True)
-                .order_by(cls.username)
-                .limit(limit)
-            )
-            users = result.scalars().all()
-            
-            db_metrics.record_operation("SELECT", "users", True)
-            return list(users)
-            
-        except Exception as e:
-            db_metrics.record_operation("SELECT", "users", False)
-            raise e
+        search_filter = (
+            cls.email.ilike(f"%{query}%") |
+            cls.username.ilike(f"%{query}%") |
+            cls.full_name.ilike(f"%{query}%")
+        )
+        
+        result = await db.execute(
+            select(cls)
+            .where(search_filter, cls.is_active == True)
+            .order_by(cls.username)
+            .limit(limit)
+        )
+        users = result.scalars().all()
+        return list(users)
     
     # Helper properties
     
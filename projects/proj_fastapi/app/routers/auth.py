@@ -1,13 +1,16 @@
 from fastapi import APIRouter, Depends, HTTPException
+from fastapi.responses import ORJSONResponse
 from datetime import datetime, timedelta
-import jwt, os
+import os
 
 router = APIRouter()
 JWT_SECRET = os.getenv("JWT_SECRET", "dev-secret")
 ALG = "HS256"
 
-@router.post("/auth/token")
+@router.post("/auth/token", response_class=ORJSONResponse)
 def issue_token(sub: str):
+    import jwt  # Deferred so worker startup doesn't pay for it
+    
     now = datetime.utcnow()
     token = jwt.encode({"sub": sub, "iat": now, "exp": now + timedelta(hours=12)}, JWT_SECRET, algorithm=ALG)
-    return {"access_token": token, "token_type": "bearer"}
\ No newline at end of file
+    return ORJSONResponse({"access_token": token, "token_type": "bearer"})
\ No newline at end of file
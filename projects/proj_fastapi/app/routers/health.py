@@ -1,6 +1,8 @@
 from fastapi import APIRouter
+from fastapi.responses import ORJSONResponse
 router = APIRouter()
-@router.get("/healthz")
-async def healthz(): return {"ok": True}
-@router.get("/readyz")
-async def readyz(): return {"ready": True}
\ No newline at end of file
+# Probes return the response directly so FastAPI skips jsonable_encoder on every hit
+@router.get("/healthz", response_class=ORJSONResponse)
+async def healthz(): return ORJSONResponse({"ok": True})
+@router.get("/readyz", response_class=ORJSONResponse)
+async def readyz(): return ORJSONResponse({"ready": True})
\ No newline at end of file
@@ -1,9 +1,18 @@
 from fastapi import APIRouter, WebSocket
 router = APIRouter()
 
+_PREFIX = b"echo: "
+
 @router.websocket("/ws/echo")
 async def ws_echo(ws: WebSocket):
     await ws.accept()
     while True:
-        data = await ws.receive_text()
-        await ws.send_text(f"echo: {data}")
\ No newline at end of file
+        # Raw receive so binary frames are echoed without a UTF-8 decode/encode roundtrip.
+        msg = await ws.receive()
+        if msg["type"] == "websocket.disconnect":
+            return
+        data = msg.get("bytes")
+        if data is not None:
+            await ws.send_bytes(_PREFIX + data)
+        else:
+            await ws.send_text("echo: " + msg["text"])
@@ -0,0 +1,253 @@
+"""OpenAPI request/response examples, keyed by schema class name.
+
+Kept out of the model classes so they are only touched when the OpenAPI
+document is generated. Only schemas that some route exposes belong here:
+apply_examples rejects a name the document does not contain.
+"""
+
+from typing import Any, Dict, List
+
+
+SCHEMA_EXAMPLES: Dict[str, Dict[str, Any]] = {
+    "LoginRequest": {
+        "email": "user@example.com",
+        "password": "securepassword123"
+    },
+    "RegisterRequest": {
+        "email": "newuser@example.com",
+        "username": "newuser123",
+        "password": "SecurePass123!",
+        "full_name": "New User"
+    },
+    "TokenResponse": {
+        "access_token": "eyJ0eXAiOiJKV1QiLCJhbGciOiJIUzI1NiJ9...",
+        "refresh_token": "eyJ0eXAiOiJKV1QiLCJhbGciOiJIUzI1NiJ9...",
+        "token_type": "bearer",
+        "expires_in": 1800
+    },
+    "LoginResponse": {
+        "access_token": "eyJ0eXAiOiJKV1QiLCJhbGciOiJIUzI1NiJ9...",
+        "refresh_token": "eyJ0eXAiOiJKV1QiLCJhbGciOiJIUzI1NiJ9...",
+        "token_type": "bearer",
+        "expires_in": 1800,
+        "user": {
+            "id": 1,
+            "email": "user@example.com",
+            "username": "user123",
+            "full_name": "John Doe",
+            "is_active": True,
+            "is_superuser": False,
+            "email_verified": True,
+            "created_at": "2024-01-01T00:00:00Z"
+        },
+        "session_id": "session_123"
+    },
+    "RefreshTokenRequest": {
+        "refresh_token": "eyJ0eXAiOiJKV1QiLCJhbGciOiJIUzI1NiJ9..."
+    },
+    "PasswordResetRequest": {
+        "email": "user@example.com"
+    },
+    "PasswordResetConfirm": {
+        "token": "reset_token_here",
+        "new_password": "NewSecurePass123!"
+    },
+    "ChangePasswordRequest": {
+        "current_password": "current_password",
+        "new_password": "NewSecurePass123!"
+    },
+    "UserCreate": {
+        "email": "newuser@example.com",
+        "username": "newuser123",
+        "full_name": "New User",
+        "password": "SecurePass123!",
+        "is_active": True,
+        "is_superuser": False,
+        "email_verified": False
+    },
+    "UserUpdate": {
+        "email": "updated@example.com",
+        "username": "updated_username",
+        "full_name": "Updated Name",
+        "bio": "Software developer passionate about Python",
+        "location": "San Francisco, CA",
+        "website": "https://example.com",
+        "is_active": True
+    },
+    "UserProfileUpdate": {
+        "username": "myusername",
+        "full_name": "My Full Name",
+        "bio": "Software developer passionate about Python and FastAPI",
+        "location": "San Francisco, CA",
+        "website": "https://mywebsite.com"
+    },
+    "UserResponse": {
+        "id": 1,
+        "email": "user@example.com",
+        "username": "user123",
+        "full_name": "John Doe",
+        "is_active": True,
+        "is_superuser": False,
+        "email_verified": True,
+        "oauth_provider": None,
+        "avatar_url": "https://example.com/avatar.jpg",
+        "bio": "Software developer",
+        "location": "San Francisco, CA",
+        "website": "https://johndoe.com",
+        "created_at": "2024-01-01T00:00:00Z",
+        "updated_at": "2024-01-01T12:00:00Z",
+        "last_login_at": "2024-01-01T11:30:00Z"
+    },
+    "UserListResponse": {
+        "users": [
+            {
+                "id": 1,
+                "email": "user1@example.com",
+                "username": "user1",
+                "full_name": "User One",
+                "is_active": True,
+                "is_superuser": False,
+                "email_verified": True,
+                "created_at": "2024-01-01T00:00:00Z",
+                "updated_at": "2024-01-01T12:00:00Z",
+                "last_login_at": "2024-01-01T11:30:00Z"
+            }
+        ],
+        "total": 50,
+        "page": 1,
+        "size": 10,
+        "pages": 5
+    }
+}
+
+
+# UserBase itself never appears in the document; UserCreate extends these
+_USER_BASE_DESCRIPTIONS: Dict[str, str] = {
+    "email": "User email address",
+    "username": "Unique username",
+    "full_name": "User's full name",
+    "is_active": "User account status",
+    "email_verified": "Email verification status"
+}
+
+# Field descriptions for every documented request/response schema, kept out of FieldInfo
+SCHEMA_DESCRIPTIONS: Dict[str, Dict[str, str]] = {
+    "LoginRequest": {
+        "email": "User email address or username",
+        "password": "User password"
+    },
+    "RegisterRequest": {
+        "email": "User email address",
+        "username": "Unique username (alphanumeric, underscore, hyphen only)",
+        "password": "Password (minimum 8 characters)",
+        "full_name": "User's full name"
+    },
+    "TokenResponse": {
+        "access_token": "JWT access token",
+        "refresh_token": "JWT refresh token",
+        "token_type": "Token type",
+        "expires_in": "Token expiration time in seconds"
+    },
+    "RefreshTokenRequest": {
+        "refresh_token": "JWT refresh token"
+    },
+    "PasswordResetRequest": {
+        "email": "User email address"
+    },
+    "PasswordResetConfirm": {
+        "token": "Password reset token",
+        "new_password": "New password"
+    },
+    "ChangePasswordRequest": {
+        "current_password": "Current password",
+        "new_password": "New password"
+    },
+    "UserUpdate": {
+        "email": "User email address",
+        "username": "Username",
+        "full_name": "User's full name",
+        "password": "New password",
+        "is_active": "User account status",
+        "is_superuser": "Superuser privileges",
+        "email_verified": "Email verification status",
+        "bio": "User biography",
+        "location": "User location",
+        "website": "User website URL",
+        "avatar_url": "Avatar image URL"
+    },
+    "UserProfileUpdate": {
+        "username": "Username",
+        "full_name": "User's full name",
+        "bio": "User biography",
+        "location": "User location",
+        "website": "User website URL"
+    },
+    "UserResponse": {
+        "id": "User ID",
+        "email": "User email address",
+        "username": "Username",
+        "full_name": "User's full name",
+        "is_active": "User account status",
+        "is_superuser": "Superuser privileges",
+        "email_verified": "Email verification status",
+        "oauth_provider": "OAuth provider",
+        "avatar_url": "Avatar image URL",
+        "bio": "User biography",
+        "location": "User location",
+        "website": "User website URL",
+        "created_at": "Account creation timestamp",
+        "updated_at": "Last update timestamp",
+        "last_login_at": "Last login timestamp"
+    },
+    "UserListResponse": {
+        "users": "List of users",
+        "total": "Total number of users",
+        "page": "Current page number",
+        "size": "Page size",
+        "pages": "Total number of pages"
+    }
+}
+
+# Subclasses extend their parent's descriptions
+SCHEMA_DESCRIPTIONS["LoginResponse"] = {
+    **SCHEMA_DESCRIPTIONS["TokenResponse"],
+    "user": "User information",
+    "session_id": "Session ID"
+}
+SCHEMA_DESCRIPTIONS["UserCreate"] = {
+    **_USER_BASE_DESCRIPTIONS,
+    "password": "User password (required for non-OAuth users)",
+    "is_superuser": "Superuser privileges"
+}
+
+
+def apply_examples(openapi_schema: Dict[str, Any]) -> Dict[str, Any]:
+    """Attach examples and field descriptions to the component schemas of an OpenAPI document.
+    
+    Raises ValueError if a schema or field named here is missing from the document, so a
+    renamed model or an unmounted router fails loudly instead of dropping the examples.
+    """
+    components = openapi_schema.get("components", {}).get("schemas", {})
+    
+    # Pydantic splits a model into -Input and -Output schemas when the two differ
+    by_name: Dict[str, List[Dict[str, Any]]] = {}
+    for name, schema in components.items():
+        by_name.setdefault(name.removesuffix("-Input").removesuffix("-Output"), []).append(schema)
+    
+    missing = (SCHEMA_EXAMPLES.keys() | SCHEMA_DESCRIPTIONS.keys()) - by_name.keys()
+    if missing:
+        raise ValueError(f"OpenAPI document has no schema named: {', '.join(sorted(missing))}")
+    
+    for name, example in SCHEMA_EXAMPLES.items():
+        for schema in by_name[name]:
+            schema["example"] = example
+    
+    for name, descriptions in SCHEMA_DESCRIPTIONS.items():
+        for schema in by_name[name]:
+            properties = schema.get("properties", {})
+            for field, description in descriptions.items():
+                if field not in properties:
+                    raise ValueError(f"OpenAPI schema {name} has no field {field!r}")
+                properties[field]["description"] = description
+    
+    return openapi_schema
@@ -0,0 +1,4 @@
+"""Regex patterns shared across Pydantic schemas."""
+
+# Kept as plain strings so pydantic-core compiles them with its Rust regex engine
+USERNAME_PATTERN = r"^[a-zA-Z0-9_-]+$"
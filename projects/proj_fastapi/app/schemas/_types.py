@@ -0,0 +1,75 @@
+"""Shared annotated field types for Pydantic schemas."""
+
+import string
+from typing import Annotated, Literal
+
+from pydantic import AfterValidator, StringConstraints, WithJsonSchema
+
+from ._patterns import USERNAME_PATTERN
+
+_EMAIL_LOCAL_CHARS = frozenset(string.ascii_letters + string.digits + "!#$%&'*+/=?^_`{|}~.-")
+_EMAIL_DOMAIN_CHARS = frozenset(string.ascii_lowercase + string.digits + ".-")
+
+
+def validate_email_fast(value: str) -> str:
+    """Validate an ASCII email address without regex or DNS lookups.
+
+    Returns the address with its domain lowercased.
+    """
+    if len(value) > 254 or not value.isascii():
+        raise ValueError("value is not a valid email address")
+
+    at = value.find("@")
+    if at <= 0 or at > 64 or value.find("@", at + 1) != -1:
+        raise ValueError("value is not a valid email address")
+
+    local = value[:at]
+    domain = value[at + 1:].lower()
+
+    if local[0] == "." or local[-1] == "." or ".." in local:
+        raise ValueError("value is not a valid email address")
+    if not _EMAIL_LOCAL_CHARS.issuperset(local):
+        raise ValueError("value is not a valid email address")
+
+    if not _EMAIL_DOMAIN_CHARS.issuperset(domain):
+        raise ValueError("value is not a valid email address")
+
+    labels = domain.split(".")
+    if len(labels) < 2:
+        raise ValueError("value is not a valid email address")
+    for label in labels:
+        if not label or len(label) > 63 or label[0] == "-" or label[-1] == "-":
+            raise ValueError("value is not a valid email address")
+
+    return f"{local}@{domain}"
+
+
+def check_http_prefix(value: str) -> str:
+    """Require an http(s) scheme without fully parsing the URL."""
+    if not value.startswith(("http://", "https://")):
+        raise ValueError("URL must start with http:// or https://")
+    return value
+
+
+FastEmail = Annotated[
+    str,
+    AfterValidator(validate_email_fast),
+    WithJsonSchema({"type": "string", "format": "email"}),
+]
+
+HttpUrlStr = Annotated[
+    str,
+    StringConstraints(max_length=2083),
+    AfterValidator(check_http_prefix),
+]
+
+
+# Opaque tokens: reset/verification JWTs, refresh JWTs and OAuth codes. The upper bound leaves
+# room for a reset token carrying a maximum-length email address.
+Token = Annotated[str, StringConstraints(min_length=16, max_length=2048)]
+
+Password = Annotated[str, StringConstraints(min_length=8, max_length=128)]
+
+Username = Annotated[str, StringConstraints(min_length=3, max_length=50, pattern=USERNAME_PATTERN)]
+
+OAuthProvider = Literal["google", "github"]
@@ -3,22 +3,31 @@
 
 import asyncio
 import os
-import subprocess
 import sys
+from argparse import Namespace
+from functools import cached_property
 from pathlib import Path
-from typing import Optional
+from typing import TYPE_CHECKING, Any, Optional
 
 # Add project root to Python path
 project_root = Path(__file__).parent.parent
 sys.path.insert(0, str(project_root))
 
-from app.core.config import settings
-from app.core.database import init_database, close_database
-from app.core.observability import setup_logging, get_logger
+# Replaced by the structured logger once a command needs it; help/init stay on loguru's default
+# stderr sink so they don't import the app's config, database and telemetry stack.
+from loguru import logger
 
-# Setup logging
-setup_logging()
-logger = get_logger("migrate")
+if TYPE_CHECKING:
+    from alembic.config import Config
+
+
+def _init_logging() -> None:
+    """Configure application logging and bind the module logger to it."""
+    global logger
+    from app.core.observability import setup_logging, get_logger
+    
+    setup_logging()
+    logger = get_logger("migrate")
 
 
 class MigrationManager:
@@ -27,44 +36,52 @@ class MigrationManager:
     def __init__(self):
         self.project_root = project_root
         self.alembic_ini = self.project_root / "alembic.ini"
+    
+    @cached_property
+    def alembic_cfg(self) -> "Config":
+        """Alembic config, parsed once and shared by every command."""
+        from alembic.config import Config
+        
+        cfg = Config(str(self.alembic_ini))
+        cfg.set_main_option("script_location", str(self.project_root / "alembic"))
+        return cfg
+        
+    def run_alembic_command(self, name: str, *args: Any, **kwargs: Any) -> bool:
+        """Run an Alembic command in-process."""
+        from alembic import command as alembic_command
+        from alembic.util import CommandError
         
-    def run_alembic_command(self, command: list[str]) -> bool:
-        """Run an Alembic command."""
         try:
-            os.chdir(self.project_root)
-            
-            cmd = ["alembic"] + command
-            logger.info(f"Running: {' '.join(cmd)}")
-            
-            result = subprocess.run(
-                cmd,
-                capture_output=True,
-                text=True,
-                check=True
-            )
-            
-            if result.stdout:
-                print(result.stdout)
-            
+            logger.info(f"Running: alembic {' '.join([name, *map(str, args)])}")
+            getattr(alembic_command, name)(self.alembic_cfg, *args, **kwargs)
             return True
             
-        except subprocess.CalledProcessError as e:
+        except CommandError as e:
             logger.error(f"Alembic command failed: {e}")
-            if e.stdout:
-                print("STDOUT:", e.stdout)
-            if e.stderr:
-                print("STDERR:", e.stderr)
             return False
         except Exception as e:
             logger.error(f"Failed to run Alembic command: {e}")
             return False
     
+    async def _alembic(self, name: str, *args: Any, **kwargs: Any) -> bool:
+        """Run an Alembic command on a worker thread.
+        
+        env.py drives its async engine with asyncio.run(), which can't nest inside
+        our event loop; the thread also keeps Ctrl-C responsive during long migrations.
+        """
+        return await asyncio.to_thread(self.run_alembic_command, name, *args, **kwargs)
+    
     async def check_database_connection(self) -> bool:
         """Check if database is accessible."""
+        from sqlalchemy import text
+        from app.core.database import database, init_database
+        
         try:
             logger.info("Checking database connection...")
+            # Keep the pool open for the command that follows; _run() disposes it on exit
             await init_database()
-            await close_database()
+            async with database.session() as session:
+                await session.execute(text("SELECT 1"))
             logger.info("✓ Database connection successful")
             return True
         except Exception as e:
@@ -72,7 +89,7 @@ class MigrationManager:
             logger.error("Please ensure your database is running and DATABASE_URL is configured")
             return False
     
-    def init_migrations(self) -> bool:
+    async def init_migrations(self) -> bool:
         """Initialize Alembic migrations."""
         logger.info("Initializing Alembic migrations...")
         
@@ -80,9 +97,9 @@ class MigrationManager:
             logger.warning("Alembic already initialized (alembic.ini exists)")
             return True
         
-        return self.run_alembic_command(["init", "alembic"])
+        return await self._alembic("init", str(self.project_root / "alembic"))
     
-    def create_migration(self, message: Optional[str] = None, auto: bool = True) -> bool:
+    async def create_migration(self, message: Optional[str] = None, auto: bool = True) -> bool:
         """Create a new migration."""
         if not message:
             message = input("Enter migration message: ").strip()
@@ -92,36 +109,45 @@ class MigrationManager:
         
         logger.info(f"Creating migration: {message}")
         
-        command = ["revision", "-m", message]
-        if auto:
-            command.append("--autogenerate")
-        
-        return self.run_alembic_command(command)
+        return await self._alembic("revision", message=message, autogenerate=auto)
     
-    def upgrade_database(self, revision: str = "head") -> bool:
+    async def upgrade_database(
+        self, revision: str = "head", page_size: Optional[int] = None
+    ) -> bool:
         """Upgrade database to specified revision."""
         logger.info(f"Upgrading database to {revision}...")
-        return self.run_alembic_command(["upgrade", revision])
+        if page_size:
+            # Same as `alembic -x page_size=N`; read by app.core.db_migrate_helpers.page_size()
+            self.alembic_cfg.cmd_opts = Namespace(x=[f"page_size={page_size}"])
+        return await self._alembic("upgrade", revision)
     
-    def downgrade_database(self, revision: str = "-1") -> bool:
+    async def downgrade_database(self, revision: str = "-1") -> bool:
         """Downgrade database to specified revision."""
         logger.info(f"Downgrading database to {revision}...")
-        return self.run_alembic_command(["downgrade", revision])
+        return await self._alembic("downgrade", revision)
     
-    def show_current_revision(self) -> bool:
+    async def show_current_revision(self) -> bool:
         """Show current database revision."""
         logger.info("Current database revision:")
-        return self.run_alembic_command(["current"])
+        return await self._alembic("current")
     
-    def show_migration_history(self) -> bool:
+    async def show_migration_history(self) -> bool:
         """Show migration history."""
         logger.info("Migration history:")
-        return self.run_alembic_command(["history", "--verbose"])
+        return await self._alembic("history", verbose=True)
     
-    def show_pending_migrations(self) -> bool:
+    async def show_pending_migrations(self) -> bool:
         """Show pending migrations."""
         logger.info("Pending migrations:")
-        return self.run_alembic_command(["show", "head"])
+        return await self._alembic("show", "head")
+
+
+async def _warm_user_model() -> None:
+    """Import the User model and build the password hasher ahead of seeding."""
+    from app.models.user import User  # noqa: F401
+    from app.core.security import password_manager
+    
+    password_manager.hasher
 
 
 async def create_initial_superuser():
@@ -133,20 +159,34 @@ async def create_initial_superuser():
         
         logger.info("Checking for initial superuser...")
         
+        # Check and insert share one transaction; database.session() commits on exit
         async with database.session() as session:
-            # Check if any superuser exists
-            superusers = await User.get_superusers(session)
-            
-            if superusers:
-                logger.info(f"Found {len(superusers)} existing superuser(s)")
+            if await User.any_superuser_exists(session):
+                logger.info("Found existing superuser")
                 return True
             
             logger.info("No superusers found. Creating initial superuser...")
             
-            # Get superuser details
-            email = os.getenv("SUPERUSER_EMAIL") or input("Superuser email: ").strip()
-            username = os.getenv("SUPERUSER_USERNAME") or input("Superuser username: ").strip()
-            password = os.getenv("SUPERUSER_PASSWORD") or input("Superuser password: ").strip()
+            # Get superuser details, prompting only for what the environment doesn't provide
+            env = os.environ
+            email = env.get("SUPERUSER_EMAIL")
+            username = env.get("SUPERUSER_USERNAME")
+            password = env.get("SUPERUSER_PASSWORD")
+            
+            if not (email and username and password):
+                if not sys.stdin.isatty():
+                    logger.error(
+                        "SUPERUSER_EMAIL, SUPERUSER_USERNAME and SUPERUSER_PASSWORD "
+                        "must be set when not running interactively"
+                    )
+                    return False
+                # input() blocks, so keep it off the event loop
+                if not email:
+                    email = (await asyncio.to_thread(input, "Superuser email: ")).strip()
+                if not username:
+                    username = (await asyncio.to_thread(input, "Superuser username: ")).strip()
+                if not password:
+                    password = (await asyncio.to_thread(input, "Superuser password: ")).strip()
             
             if not all([email, username, password]):
                 logger.error("Email, username, and password are required")
@@ -163,7 +203,9 @@ async def create_initial_superuser():
                 "email_verified": True,
             }
             
-            user = await User.create(session, **user_data)
+            user = User(**user_data)
+            session.add(user)
+            await session.flush()
             logger.info(f"Created superuser: {user.email} (ID: {user.id})")
             
             return True
@@ -173,9 +215,7 @@ async def create_initial_superuser():
         return False
 
 
-def print_help():
-    """Print help information."""
-    print("""
+_HELP_TEXT = """
 🗃️  Database Migration Utility
 
 USAGE:
@@ -185,7 +225,9 @@ COMMANDS:
     init                    Initialize Alembic migrations
     create [message]        Create new migration (auto-generate)
     create-empty [message]  Create empty migration template
-    upgrade [revision]      Upgrade to revision (default: head)
+    upgrade [revision] [--page-size N]
+                            Upgrade to revision (default: head); N is the batch
+                            size for data migrations (default: 100)
     downgrade [revision]    Downgrade to revision (default: -1)
     current                 Show current revision
     history                 Show migration history
@@ -198,16 +240,33 @@ COMMANDS:
 EXAMPLES:
     python scripts/migrate.py create "Add user table"
     python scripts/migrate.py upgrade
+    python scripts/migrate.py upgrade head --page-size 500
     python scripts/migrate.py downgrade -1
     python scripts/migrate.py current
     python scripts/migrate.py seed
 
+DATA MIGRATIONS:
+    Backfills over large tables should page through rows with the helpers in
+    app/core/db_migrate_helpers.py rather than load them in one transaction:
+
+        for rows in paginated(op.get_bind(), query, table.c.id, page_size()):
+            with batch_commit(op.get_context()):
+                ...
+
+    paginated() fetches each page with its own keyset query on a unique key column,
+    so committing between pages is safe.
+
 ENVIRONMENT VARIABLES:
     DATABASE_URL           Database connection string
     SUPERUSER_EMAIL        Initial superuser email
     SUPERUSER_USERNAME     Initial superuser username  
     SUPERUSER_PASSWORD     Initial superuser password
-""")
+"""
+
+
+def print_help():
+    """Print help information."""
+    sys.stdout.write(_HELP_TEXT)
 
 
 async def main():
@@ -223,13 +282,15 @@ async def main():
     
     # Commands that don't require database connection
     if command == "init":
-        success = migration_manager.init_migrations()
+        success = await migration_manager.init_migrations()
         sys.exit(0 if success else 1)
     
     if command == "help":
         print_help()
         return
     
+    _init_logging()
+    
     # Check database connection for other commands
     if not await migration_manager.check_database_connection():
         logger.error("Cannot proceed without database connection")
@@ -240,44 +301,53 @@ async def main():
     
     if command == "create":
         message = args[1] if len(args) > 1 else None
-        success = migration_manager.create_migration(message, auto=True)
+        success = await migration_manager.create_migration(message, auto=True)
         
     elif command == "create-empty":
         message = args[1] if len(args) > 1 else None
-        success = migration_manager.create_migration(message, auto=False)
+        success = await migration_manager.create_migration(message, auto=False)
         
     elif command == "upgrade":
+        page_size = None
+        if "--page-size" in args:
+            i = args.index("--page-size")
+            page_size = int(args[i + 1])
+            del args[i:i + 2]
         revision = args[1] if len(args) > 1 else "head"
-        success = migration_manager.upgrade_database(revision)
+        success = await migration_manager.upgrade_database(revision, page_size=page_size)
         
     elif command == "downgrade":
         revision = args[1] if len(args) > 1 else "-1"
-        success = migration_manager.downgrade_database(revision)
+        success = await migration_manager.downgrade_database(revision)
         
     elif command == "current":
-        success = migration_manager.show_current_revision()
+        success = await migration_manager.show_current_revision()
         
     elif command == "history":
-        success = migration_manager.show_migration_history()
+        success = await migration_manager.show_migration_history()
         
     elif command == "pending":
-        success = migration_manager.show_pending_migrations()
+        success = await migration_manager.show_pending_migrations()
         
     elif command == "check":
         success = await migration_manager.check_database_connection()
         
     elif command == "seed":
-        # First upgrade database, then create superuser
-        if migration_manager.upgrade_database():
+        # Upgrade the database while the User model and password hasher load
+        upgraded, _ = await asyncio.gather(
+            migration_manager.upgrade_database(),
+            _warm_user_model(),
+        )
+        if upgraded:
             success = await create_initial_superuser()
         
     elif command == "reset":
         confirm = input("⚠️  This will reset the database. Type 'yes' to continue: ")
         if confirm.lower() == "yes":
             logger.info("Resetting database...")
-            success = migration_manager.downgrade_database("base")
+            success = await migration_manager.downgrade_database("base")
             if success:
-                success = migration_manager.upgrade_database()
+                success = await migration_manager.upgrade_database()
         else:
             logger.info("Database reset cancelled")
             success = True
@@ -290,13 +360,32 @@ async def main():
     sys.exit(0 if success else 1)
 
 
+
+async def _run() -> None:
+    """Run main() and release the database pool before the loop shuts down."""
+    try:
+        await main()
+    finally:
+        # Only commands that touched the database imported it
+        db = sys.modules.get("app.core.database")
+        if db is not None:
+            await db.close_database()
+
+
 if __name__ == "__main__":
     try:
         # Ensure we're in the right directory
         os.chdir(project_root)
         
         # Run the migration utility
-        asyncio.run(main())
+        try:
+            import uvloop
+        except ImportError:  # Not available on Windows
+            pass
+        else:
+            asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+        with asyncio.Runner() as runner:
+            runner.run(_run())
         
     except KeyboardInterrupt:
         print("\n👋 Migration utility stopped")
@@ -5,12 +5,19 @@ import asyncio
 import os
 import sys
 from pathlib import Path
+from typing import Awaitable, Callable, Optional
 
 # Add project root to Python path
 project_root = Path(__file__).parent.parent
 sys.path.insert(0, str(project_root))
 
 import uvicorn
+
+try:
+    import uvloop
+except ImportError:  # Not available on Windows
+    uvloop = None
+
 from app.core.config import settings
 from app.core.observability import setup_logging, get_logger
 
@@ -19,7 +26,16 @@ setup_logging()
 logger = get_logger("dev_server")
 
 
-async def check_dependencies():
+async def _try(probe: Callable[[], Awaitable[None]]) -> Optional[Exception]:
+    """Await a startup probe, returning its exception instead of raising."""
+    try:
+        await probe()
+    except Exception as e:
+        return e
+    return None
+
+
+async def check_dependencies(probe_services: bool = True):
     """Check if required services are available."""
     logger.info("Checking dependencies...")
     
@@ -31,22 +47,27 @@ async def check_dependencies():
         logger.error(f"✗ Failed to import FastAPI app: {e}")
         return False
     
-    # Check database connection
-    try:
-        from app.core.database import init_database
-        await init_database()
+    if not probe_services:
+        # The reloader's worker process connects on its own startup
+        logger.info("Skipping database/Redis probes (reload mode)")
+        return True
+    
+    from app.core.database import init_database
+    from app.core.redis import init_redis
+    
+    # Database and Redis handshakes are independent, so run them concurrently
+    db_error, redis_error = await asyncio.gather(_try(init_database), _try(init_redis))
+    
+    if db_error is None:
         logger.info("✓ Database connection successful")
-    except Exception as e:
-        logger.warning(f"⚠ Database connection failed: {e}")
+    else:
+        logger.warning(f"⚠ Database connection failed: {db_error}")
         logger.info("  Database will be available when you configure DATABASE_URL")
     
-    # Check Redis connection
-    try:
-        from app.core.redis import init_redis
-        await init_redis()
+    if redis_error is None:
         logger.info("✓ Redis connection successful")
-    except Exception as e:
-        logger.warning(f"⚠ Redis connection failed: {e}")
+    else:
+        logger.warning(f"⚠ Redis connection failed: {redis_error}")
         logger.info("  Redis will be available when you configure REDIS_URL")
     
     return True
@@ -54,64 +75,81 @@ async def check_dependencies():
 
 def print_startup_info():
     """Print startup information and available endpoints."""
-    print("\n" + "="*60)
-    print("🚀 Elite FastAPI Development Server")
-    print("="*60)
-    print(f"Application: {settings.app_name}")
-    print(f"Version: {settings.app_version}")
-    print(f"Environment: {settings.otel_environment}")
-    print(f"Debug Mode: {settings.debug}")
-    print(f"Host: {settings.host}")
-    print(f"Port: {settings.port}")
-    print("-"*60)
-    
-    base_url = f"http://{settings.host}:{settings.port}"
-    
-    print("📍 Available Endpoints:")
-    print(f"  • Application: {base_url}/")
-    print(f"  • Health Check: {base_url}/healthz")
-    print(f"  • Readiness: {base_url}/readyz")
-    
-    if settings.debug:
-        print(f"  • API Docs: {base_url}/docs")
-        print(f"  • ReDoc: {base_url}/redoc")
-        print(f"  • OpenAPI JSON: {base_url}{settings.api_v1_prefix}/openapi.json")
-    
-    if settings.prometheus_metrics_enabled:
-        print(f"  • Metrics: {base_url}/metrics")
-    
-    print(f"  • API v1: {base_url}{settings.api_v1_prefix}")
-    print(f"    - Auth: {base_url}{settings.api_v1_prefix}/auth")
-    print(f"    - Users: {base_url}{settings.api_v1_prefix}/users")
-    
-    if settings.feature_websocket:
-        ws_url = f"ws://{settings.host}:{settings.port}"
-        print(f"    - WebSocket: {ws_url}{settings.api_v1_prefix}/ws/connect")
-    
-    print("-"*60)
-    print("⚙️  Configuration:")
-    print(f"  • Database: {settings.database_url_str[:50]}..." if settings.database_url_str else "  • Database: Not configured")
-    print(f"  • Redis: {settings.redis_url_str[:50]}..." if settings.redis_url_str else "  • Redis: Not configured")
-    print(f"  • JWT Secret: {'*' * 20}[HIDDEN]")
-    print(f"  • CORS Origins: {settings.cors_origins}")
-    
-    print("-"*60)
-    print("🛠️  Development Commands:")
-    print("  • Run tests: python -m pytest")
-    print("  • Run migrations: python scripts/migrate.py")
-    print("  • Format code: ruff format . && black .")
-    print("  • Type check: mypy .")
-    print("  • Lint: ruff check .")
-    print("="*60)
-    print()
+    s = settings
+    host, port, prefix, debug = s.host, s.port, s.api_v1_prefix, s.debug
+    database_url, redis_url = s.database_url_str, s.redis_url_str
+    
+    base_url = f"http://{host}:{port}"
+    api_url = f"{base_url}{prefix}"
+    rule, divider = "=" * 60, "-" * 60
+    
+    lines = [
+        "",
+        rule,
+        "🚀 Elite FastAPI Development Server",
+        rule,
+        f"Application: {s.app_name}",
+        f"Version: {s.app_version}",
+        f"Environment: {s.otel_environment}",
+        f"Debug Mode: {debug}",
+        f"Host: {host}",
+        f"Port: {port}",
+        divider,
+        "📍 Available Endpoints:",
+        f"  • Application: {base_url}/",
+        f"  • Health Check: {base_url}/healthz",
+        f"  • Readiness: {base_url}/readyz",
+    ]
+    
+    if debug:
+        lines += [
+            f"  • API Docs: {base_url}/docs",
+            f"  • ReDoc: {base_url}/redoc",
+            f"  • OpenAPI JSON: {api_url}/openapi.json",
+        ]
+    
+    if s.prometheus_metrics_enabled:
+        lines.append(f"  • Metrics: {base_url}/metrics")
+    
+    lines += [
+        f"  • API v1: {api_url}",
+        f"    - Auth: {api_url}/auth",
+        f"    - Users: {api_url}/users",
+    ]
+    
+    if s.feature_websocket:
+        lines.append(f"    - WebSocket: ws://{host}:{port}{prefix}/ws/connect")
+    
+    lines += [
+        divider,
+        "⚙️  Configuration:",
+        f"  • Database: {database_url[:50] + '...' if database_url else 'Not configured'}",
+        f"  • Redis: {redis_url[:50] + '...' if redis_url else 'Not configured'}",
+        f"  • JWT Secret: {'*' * 20}[HIDDEN]",
+        f"  • CORS Origins: {s.cors_origins}",
+        divider,
+        "🛠️  Development Commands:",
+        "  • Run tests: python -m pytest",
+        "  • Run migrations: python scripts/migrate.py",
+        "  • Format code: ruff format . && black .",
+        "  • Type check: mypy .",
+        "  • Lint: ruff check .",
+        rule,
+        "",
+    ]
+    
+    sys.stdout.write("\n".join(lines) + "\n")
+    sys.stdout.flush()
 
 
 async def run_development_server():
     """Run the development server with proper setup."""
     logger.info("Starting Elite FastAPI development server...")
     
+    reload = True
+    
     # Check dependencies
-    if not await check_dependencies():
+    if not await check_dependencies(probe_services=not (settings.debug and reload)):
         logger.error("Dependency check failed. Please fix the issues above.")
         return
     
@@ -123,12 +161,14 @@ async def run_development_server():
         app="app.main:app",
         host=settings.host,
         port=settings.port,
-        reload=True,
+        reload=reload,
         reload_dirs=["app", "scripts"],
         log_config=None,  # Use our loguru setup
         access_log=False,  # Use our middleware
         server_header=False,
         date_header=False,
+        http="httptools",
+        ws_per_message_deflate=False,  # Frames are small; deflate setup costs more than it saves
     )
     
     server = uvicorn.Server(config)
@@ -148,7 +188,9 @@ def main():
         # Ensure we're in the right directory
         os.chdir(project_root)
         
-        # Run the server
+        # Run the server; uvicorn.Config(loop=...) only applies to Server.run(), so set it here
+        if uvloop is not None:
+            asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
         asyncio.run(run_development_server())
         
     except KeyboardInterrupt:
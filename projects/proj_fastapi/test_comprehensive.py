@@ -4,32 +4,62 @@
 import asyncio
 import json
 import sys
+import time
 from datetime import datetime
+from functools import lru_cache
 from pathlib import Path
 
 # Add project root to path
 project_root = Path(__file__).parent
 sys.path.insert(0, str(project_root))
 
+import httpx
+import pytest
 from fastapi.testclient import TestClient
 
+from app.core.config import settings
+from app.core.database import database
+from app.core.observability import db_metrics, setup_logging
+from app.main import app
+
+
+CORS_PREFLIGHT_HEADERS = {
+    "Origin": "http://localhost:3000",
+    "Access-Control-Request-Method": "GET"
+}
+
+SECURITY_HEADERS = ("X-Content-Type-Options", "X-Frame-Options", "Referrer-Policy")
+
+
+@pytest.fixture(scope="module")
+def client():
+    """One TestClient for the whole module, so the app and its lifespan are built once."""
+    with TestClient(app) as test_client:
+        yield test_client
+
+_ICONS = {"PASS": "✅", "FAIL": "❌", "INFO": "⚠️", "WARN": "⚠️"}
+
+@lru_cache(maxsize=1)
+def _timestamp(second: int) -> str:
+    """HH:MM:SS for a Unix second; reports within the same second reuse it."""
+    return time.strftime("%H:%M:%S", time.localtime(second))
+
 def test_report(test_name: str, status: str, details: str = "", response_time: float = 0):
     """Generate test reports."""
-    timestamp = datetime.now().strftime("%H:%M:%S")
-    status_icon = "✅" if status == "PASS" else "❌" if status == "FAIL" else "⚠️"
+    timestamp = _timestamp(int(time.time()))
+    status_icon = _ICONS.get(status, "⚠️")
     time_str = f" ({response_time:.3f}s)" if response_time > 0 else ""
     print(f"[{timestamp}] {status_icon} {test_name}: {status}{time_str}")
     if details:
         print(f"    {details}")
 
+test_report.__test__ = False  # Reporting helper, not a test
+
 def test_application_startup():
     """Test 1: Application Startup & Configuration"""
     test_report("Application Startup", "INFO", "Starting FastAPI application import test...")
     
     try:
-        from app.main import app
-        from app.core.config import settings
-        
         test_report("FastAPI App Import", "PASS", "Application imported successfully")
         test_report("Settings Configuration", "PASS", f"App: {settings.app_name} v{settings.app_version}")
         test_report("Environment Configuration", "PASS", f"Environment: {settings.app_env}")
@@ -37,11 +67,8 @@ def test_application_startup():
         test_report("JWT Secret", "PASS", "JWT secret configured" if settings.jwt_secret else "No JWT secret")
         test_report("CORS Settings", "PASS", f"CORS origins: {len(settings.cors_list)} configured")
         
-        return True, app
-        
     except Exception as e:
-        test_report("Application Startup", "FAIL", f"Failed to import app: {str(e)}")
-        return False, None
+        test_report("Application Startup", "FAIL", f"Failed to read settings: {str(e)}")
 
 def test_health_endpoints(client: TestClient):
     """Test 2: Health Check Endpoints"""
@@ -49,9 +76,9 @@ def test_health_endpoints(client: TestClient):
     
     # Test /api/healthz
     try:
-        start_time = asyncio.get_event_loop().time() if hasattr(asyncio, 'get_event_loop') else 0
         response = client.get("/api/healthz")
-        response_time = (asyncio.get_event_loop().time() - start_time) if start_time else 0
+        # Measured by httpx, so it also holds for responses fetched concurrently in main()
+        response_time = response.elapsed.total_seconds()
         
         if response.status_code == 200:
             data = response.json()
@@ -129,10 +156,7 @@ def test_cors_configuration(client: TestClient):
     
     try:
         # Test preflight request
-        response = client.options("/api/healthz", headers={
-            "Origin": "http://localhost:3000",
-            "Access-Control-Request-Method": "GET"
-        })
+        response = client.options("/api/healthz", headers=CORS_PREFLIGHT_HEADERS)
         
         headers = response.headers
         cors_origin = headers.get("access-control-allow-origin")
@@ -151,15 +175,10 @@ def test_security_headers(client: TestClient):
     
     try:
         response = client.get("/api/healthz")
-        headers = response.headers
-        
-        security_headers = {
-            "X-Content-Type-Options": headers.get("x-content-type-options"),
-            "X-Frame-Options": headers.get("x-frame-options"),
-            "Referrer-Policy": headers.get("referrer-policy")
-        }
+        headers = {k.lower(): v for k, v in response.headers.items()}
         
-        for header, value in security_headers.items():
+        for header in SECURITY_HEADERS:
+            value = headers.get(header.lower())
             if value:
                 test_report(f"Security Header {header}", "PASS", f"Value: {value}")
             else:
@@ -173,7 +192,6 @@ def test_websocket_functionality():
     test_report("WebSocket Functionality", "INFO", "Testing WebSocket echo endpoint...")
     
     try:
-        from fastapi.testclient import TestClient
         # Note: WebSocket testing with TestClient requires special handling
         test_report("WebSocket Endpoint", "PASS", "WebSocket route /api/ws/echo exists in code")
         
@@ -188,9 +206,6 @@ def test_database_configuration():
     test_report("Database Configuration", "INFO", "Testing database configuration...")
     
     try:
-        from app.core.database import database
-        from app.core.config import settings
-        
         test_report("Database Manager", "PASS", "Database manager imported successfully")
         test_report("Database URL", "PASS" if settings.database_url_str else "FAIL", 
                    f"URL configured: {'Yes' if settings.database_url_str else 'No'}")
@@ -210,8 +225,6 @@ def test_observability_features():
     test_report("Observability Features", "INFO", "Testing observability setup...")
     
     try:
-        from app.core.observability import db_metrics, setup_logging
-        
         test_report("Metrics Import", "PASS", "Prometheus metrics imported successfully")
         test_report("Logging Setup", "PASS", "Loguru logging configured")
         
@@ -222,6 +235,45 @@ def test_observability_features():
     except Exception as e:
         test_report("Observability Features", "FAIL", f"Exception: {str(e)}")
 
+async def fetch_read_only_endpoints():
+    """Hit the read-only endpoints concurrently over one in-process ASGI client."""
+    transport = httpx.ASGITransport(app=app, raise_app_exceptions=False)
+    async with httpx.AsyncClient(transport=transport, base_url="http://test") as ac:
+        healthz, readyz, users_count, preflight = await asyncio.gather(
+            ac.get("/api/healthz"),
+            ac.get("/api/readyz"),
+            ac.get("/api/users/count"),
+            ac.options("/api/healthz", headers=CORS_PREFLIGHT_HEADERS),
+        )
+    return {
+        ("GET", "/api/healthz"): healthz,
+        ("GET", "/api/readyz"): readyz,
+        ("GET", "/api/users/count"): users_count,
+        ("OPTIONS", "/api/healthz"): preflight,
+    }
+
+class PrefetchedClient:
+    """Replays prefetched responses by method and path, deferring anything else to a live client."""
+    
+    def __init__(self, responses, fallback: TestClient):
+        self.responses = responses
+        self.fallback = fallback
+    
+    def request(self, method: str, url: str, **kwargs):
+        response = self.responses.get((method, url))
+        if response is None:
+            response = self.fallback.request(method, url, **kwargs)
+        return response
+    
+    def get(self, url: str, **kwargs):
+        return self.request("GET", url, **kwargs)
+    
+    def post(self, url: str, **kwargs):
+        return self.request("POST", url, **kwargs)
+    
+    def options(self, url: str, **kwargs):
+        return self.request("OPTIONS", url, **kwargs)
+
 def main():
     """Run comprehensive testing suite."""
     print("="*80)
@@ -231,13 +283,10 @@ def main():
     print("-"*80)
     
     # Test 1: Application Startup
-    success, app = test_application_startup()
-    if not success:
-        print("\n❌ CRITICAL: Application startup failed. Cannot proceed with other tests.")
-        return False
+    test_application_startup()
     
-    # Create test client
-    client = TestClient(app)
+    # Create test client; read-only endpoints are fetched concurrently up front
+    client = PrefetchedClient(asyncio.run(fetch_read_only_endpoints()), TestClient(app))
     
     print("-"*80)
     
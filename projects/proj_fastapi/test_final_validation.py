@@ -2,42 +2,87 @@
 """Final validation testing for FastAPI backend production readiness."""
 
 import asyncio
-import json
 import sys
 import time
+from array import array
+from contextvars import ContextVar
 from datetime import datetime
 from pathlib import Path
+from statistics import fmean
+from typing import List, Optional
 
 # Add project root to path
 project_root = Path(__file__).parent
 sys.path.insert(0, str(project_root))
 
-from fastapi.testclient import TestClient
+import httpx
+import orjson
+import pytest
+import pytest_asyncio
+
+from app.core.config import settings
+from app.main import app
+from app.routers.realtime import router as realtime_router
+
+# Where test_report collects its lines: main()'s output log, or a concurrent check's own
+# buffer. Unset under pytest, where reports print directly.
+_report_lines: ContextVar[Optional[List[str]]] = ContextVar("_report_lines", default=None)
+
+# Monotonic integer-nanosecond clock for all benchmark timing
+_pc = time.perf_counter_ns
+
+# Health benchmark sizing: batches of 10 concurrent requests until 0.2s or 1000 samples
+BENCH_CONCURRENCY = 10
+BENCH_MAX_REQUESTS = 1000
+BENCH_MIN_DURATION_NS = 200_000_000
+
+# (display name, lowercased lookup key, expected value)
+SECURITY_CHECKS = (
+    ("X-Content-Type-Options", "x-content-type-options", "nosniff"),
+    ("X-Frame-Options", "x-frame-options", "DENY"),
+    ("Referrer-Policy", "referrer-policy", "no-referrer"),
+)
+
+# Same loop as tests/, so a combined run never tears a loop down under the session fixtures
+session_loop = pytest.mark.asyncio(loop_scope="session")
+
+@pytest_asyncio.fixture(loop_scope="session")
+async def client():
+    """In-process ASGI client for the checks when they run under pytest."""
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://test") as ac:
+        yield ac
 
 def test_report(test_name: str, status: str, details: str = "", response_time: float = 0):
     """Generate test reports."""
     timestamp = datetime.now().strftime("%H:%M:%S")
     status_icon = "✅" if status == "PASS" else "❌" if status == "FAIL" else "⚠️"
     time_str = f" ({response_time:.3f}s)" if response_time > 0 else ""
-    print(f"[{timestamp}] {status_icon} {test_name}: {status}{time_str}")
+    line = f"[{timestamp}] {status_icon} {test_name}: {status}{time_str}"
     if details:
-        print(f"    {details}")
+        line += f"\n    {details}"
+    
+    lines = _report_lines.get()
+    if lines is None:
+        print(line)
+    else:
+        lines.append(line)
+
+test_report.__test__ = False  # Reporting helper, not a test
 
-def test_database_integration_fixed():
+@session_loop
+async def test_database_integration_fixed(client: httpx.AsyncClient):
     """Test database integration with the SSL fix."""
     test_report("Database Integration (Fixed)", "INFO", "Testing database with SSL fix...")
     
     try:
-        from app.main import app
-        client = TestClient(app)
-        
         # Test the users count endpoint which uses database
-        start_time = time.time()
-        response = client.get("/api/users/count")
-        response_time = time.time() - start_time
+        start_ns = _pc()
+        response = await client.get("/api/users/count")
+        response_time = (_pc() - start_ns) * 1e-9
         
         if response.status_code == 200:
-            data = response.json()
+            data = orjson.loads(response.content)
             test_report("Database Connection", "PASS", f"Response: {data}", response_time)
             test_report("Database Query", "PASS", "SELECT query executed successfully")
             return True
@@ -57,13 +102,13 @@ def test_websocket_endpoint_structure():
     test_report("WebSocket Endpoint Structure", "INFO", "Testing WebSocket route configuration...")
     
     try:
-        from app.routers.realtime import router
-        
         # Check if WebSocket route exists in the router
-        websocket_routes = [route for route in router.routes if hasattr(route, 'path') and 'ws' in route.path]
+        websocket_route = next(
+            (route for route in realtime_router.routes if "ws" in getattr(route, "path", "")), None
+        )
         
-        if websocket_routes:
-            test_report("WebSocket Route", "PASS", f"Found WebSocket route: {websocket_routes[0].path}")
+        if websocket_route is not None:
+            test_report("WebSocket Route", "PASS", f"Found WebSocket route: {websocket_route.path}")
             test_report("WebSocket Handler", "PASS", "WebSocket echo handler function exists")
             return True
         else:
@@ -74,32 +119,50 @@ def test_websocket_endpoint_structure():
         test_report("WebSocket Endpoint", "FAIL", f"Exception: {str(e)}")
         return False
 
-def test_performance_benchmarks():
+async def timed_get(client: httpx.AsyncClient, url: str):
+    """GET ``url`` and return the response with its latency in nanoseconds."""
+    start_ns = _pc()
+    response = await client.get(url)
+    return response, _pc() - start_ns
+
+async def sample_latencies(client: httpx.AsyncClient, url: str):
+    """Warm up once, then sample in concurrent batches until enough time has been measured."""
+    await client.get(url)
+    
+    results = []
+    start_ns = _pc()
+    while _pc() - start_ns < BENCH_MIN_DURATION_NS and len(results) < BENCH_MAX_REQUESTS:
+        results += await asyncio.gather(*(timed_get(client, url) for _ in range(BENCH_CONCURRENCY)))
+    return results
+
+@session_loop
+async def test_performance_benchmarks(client: httpx.AsyncClient):
     """Test performance benchmarks."""
     test_report("Performance Benchmarks", "INFO", "Running performance tests...")
     
     try:
-        from app.main import app
-        client = TestClient(app)
-        
-        # Test health endpoint performance
-        times = []
-        for i in range(10):
-            start_time = time.time()
-            response = client.get("/api/healthz")
-            response_time = time.time() - start_time
-            times.append(response_time)
-            
+        # Test health endpoint performance; the requests run concurrently over ASGI
+        results = await sample_latencies(client, "/api/healthz")
+        
+        # Reduce in integer nanoseconds; convert to seconds only for reporting
+        times = array("q", (elapsed_ns for _, elapsed_ns in results))
+        min_ns = max_ns = times[0]
+        for i, (response, elapsed_ns) in enumerate(results):
             if response.status_code != 200:
                 test_report("Performance Test", "FAIL", f"Request {i+1} failed")
                 return False
+            if elapsed_ns < min_ns:
+                min_ns = elapsed_ns
+            elif elapsed_ns > max_ns:
+                max_ns = elapsed_ns
         
-        avg_time = sum(times) / len(times)
-        max_time = max(times)
-        min_time = min(times)
+        avg_time = fmean(times) * 1e-9
+        max_time = max_ns * 1e-9
+        min_time = min_ns * 1e-9
         
         test_report("Health Endpoint Performance", "PASS", 
-                   f"Avg: {avg_time:.3f}s, Max: {max_time:.3f}s, Min: {min_time:.3f}s")
+                   f"Avg: {avg_time:.3f}s, Max: {max_time:.3f}s, Min: {min_time:.3f}s "
+                   f"over {len(times)} requests")
         
         if avg_time < 0.1:  # Under 100ms average
             test_report("Performance Target", "PASS", "Average response time under 100ms")
@@ -107,9 +170,9 @@ def test_performance_benchmarks():
             test_report("Performance Target", "WARN", f"Average response time: {avg_time:.3f}s")
         
         # Test auth endpoint performance
-        start_time = time.time()
-        response = client.post("/api/auth/token?sub=testuser")
-        response_time = time.time() - start_time
+        start_ns = _pc()
+        response = await client.post("/api/auth/token?sub=testuser")
+        response_time = (_pc() - start_ns) * 1e-9
         
         if response.status_code == 200:
             test_report("Auth Endpoint Performance", "PASS", f"JWT generation: {response_time:.3f}s")
@@ -122,28 +185,26 @@ def test_performance_benchmarks():
         test_report("Performance Benchmarks", "FAIL", f"Exception: {str(e)}")
         return False
 
-def test_error_handling():
+@session_loop
+async def test_error_handling(client: httpx.AsyncClient):
     """Test error handling and edge cases."""
     test_report("Error Handling", "INFO", "Testing error conditions...")
     
     try:
-        from app.main import app
-        client = TestClient(app)
-        
         # Test invalid endpoints
-        response = client.get("/api/nonexistent")
+        response = await client.get("/api/nonexistent")
         if response.status_code == 404:
             test_report("404 Error Handling", "PASS", "Returns 404 for invalid endpoints")
         else:
             test_report("404 Error Handling", "FAIL", f"Status: {response.status_code}")
         
         # Test invalid methods
-        response = client.delete("/api/healthz")
+        response = await client.delete("/api/healthz")
         test_report("Method Not Allowed", "PASS" if response.status_code == 405 else "WARN", 
                    f"DELETE on GET endpoint: {response.status_code}")
         
         # Test malformed auth request
-        response = client.post("/api/auth/token")  # Missing sub parameter
+        response = await client.post("/api/auth/token")  # Missing sub parameter
         test_report("Auth Error Handling", "PASS" if response.status_code in [400, 422] else "WARN",
                    f"Missing parameter handling: {response.status_code}")
         
@@ -153,39 +214,33 @@ def test_error_handling():
         test_report("Error Handling", "FAIL", f"Exception: {str(e)}")
         return False
 
-def test_security_configuration():
+@session_loop
+async def test_security_configuration(client: httpx.AsyncClient):
     """Test security configuration."""
     test_report("Security Configuration", "INFO", "Testing security settings...")
     
     try:
-        from app.main import app
-        from app.core.config import settings
-        client = TestClient(app)
-        
         # Test security headers
-        response = client.get("/api/healthz")
+        response = await client.get("/api/healthz")
         headers = response.headers
         
-        security_checks = [
-            ("X-Content-Type-Options", "nosniff"),
-            ("X-Frame-Options", "DENY"),
-            ("Referrer-Policy", "no-referrer")
-        ]
-        
         all_secure = True
-        for header, expected in security_checks:
-            actual = headers.get(header.lower())
+        for header, key, expected in SECURITY_CHECKS:
+            actual = headers.get(key)
             if actual == expected:
                 test_report(f"Security Header {header}", "PASS", f"Set to: {actual}")
             else:
                 test_report(f"Security Header {header}", "FAIL", f"Expected: {expected}, Got: {actual}")
                 all_secure = False
         
+        cors_count = len(settings.cors_list)
+        jwt_secret_length = len(settings.jwt_secret or "")
+        
         # Test CORS configuration
-        test_report("CORS Configuration", "PASS", f"Origins: {len(settings.cors_list)} configured")
+        test_report("CORS Configuration", "PASS", f"Origins: {cors_count} configured")
         
         # Test JWT configuration
-        if settings.jwt_secret and len(settings.jwt_secret) > 20:
+        if jwt_secret_length > 20:
             test_report("JWT Secret Security", "PASS", "JWT secret is configured and sufficient length")
         else:
             test_report("JWT Secret Security", "WARN", "JWT secret may be too short for production")
@@ -196,121 +251,138 @@ def test_security_configuration():
         test_report("Security Configuration", "FAIL", f"Exception: {str(e)}")
         return False
 
-def generate_production_readiness_report():
+# Database integration, error handling and security configuration
+CONCURRENT_CHECKS = (
+    test_database_integration_fixed,
+    test_error_handling,
+    test_security_configuration,
+)
+
+async def run_buffered(check, *args):
+    """Run a check, collecting its report lines instead of printing them."""
+    lines = []
+    _report_lines.set(lines)  # gather() gives each check its own context copy
+    success = await check(*args)
+    return success, lines
+
+def generate_production_readiness_report() -> str:
     """Generate final production readiness report."""
-    print("\n" + "="*100)
-    print("🚀 FINAL PRODUCTION READINESS REPORT")
-    print("="*100)
-    print(f"Assessment Date: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
-    print(f"FastAPI Version: 0.115.x")
-    print(f"Application: FANZ FastAPI v0.1.0")
-    print("-"*100)
-    
-    # Summary from comprehensive tests
-    print("📊 COMPREHENSIVE TEST SUMMARY:")
-    print("✅ Application Startup & Configuration: PASSED")
-    print("✅ Health Check Endpoints: PASSED")  
-    print("✅ Authentication System (JWT): PASSED")
-    print("⚠️  API Endpoints: MOSTLY PASSED (Database SSL issue fixed)")
-    print("✅ CORS Configuration: PASSED")
-    print("✅ Security Headers: PASSED")
-    print("⚠️  WebSocket Functionality: STRUCTURE VALIDATED")
-    print("✅ Database Configuration: PASSED")
-    print("✅ Observability Features: PASSED")
-    
-    print("\n🔧 TECHNICAL SPECIFICATIONS:")
-    print("• Framework: FastAPI with async/await support")
-    print("• Database: PostgreSQL with AsyncPG driver")
-    print("• Authentication: JWT with HS256 algorithm")
-    print("• Observability: OpenTelemetry + Prometheus metrics")
-    print("• Logging: Structured logging with Loguru")
-    print("• Security: CORS, security headers, request validation")
-    print("• WebSocket: Real-time echo endpoint available")
-    
-    print("\n⚡ PERFORMANCE METRICS:")
-    print("• Health endpoint: < 50ms average response time")
-    print("• JWT generation: < 100ms response time")
-    print("• Memory usage: Optimized with connection pooling")
-    print("• Async operations: Full async/await implementation")
-    
-    print("\n🛡️ SECURITY ASSESSMENT:")
-    print("✅ Security headers properly configured")
-    print("✅ CORS policy configured for development/production")
-    print("✅ JWT authentication with proper token structure")
-    print("✅ Request validation with Pydantic models")
-    print("⚠️  JWT secret should be rotated for production")
-    
-    print("\n🔍 IDENTIFIED ISSUES & FIXES:")
-    print("✅ FIXED: Database SSL connection parameter (sslmode → ssl)")
-    print("✅ FIXED: Missing server configuration (host/port)")
-    print("✅ FIXED: Missing dependencies (psycopg2-binary, httpx)")
-    print("⚠️  TODO: Live WebSocket testing requires running server")
-    print("⚠️  TODO: Production JWT secret rotation")
-    
-    print("\n📋 PRODUCTION DEPLOYMENT CHECKLIST:")
-    print("✅ Environment variables properly configured")
-    print("✅ Database connection string validated")
-    print("✅ Security headers implemented")
-    print("✅ Health check endpoints working")
-    print("✅ Logging and monitoring configured")
-    print("⚠️  Generate production JWT secret")
-    print("⚠️  Configure production CORS origins")
-    print("⚠️  Set up production database with proper SSL")
-    print("⚠️  Configure Redis for production caching")
-    print("⚠️  Set up load balancer health checks")
-    
-    print("\n🎯 OVERALL ASSESSMENT:")
-    print("STATUS: ✅ PRODUCTION READY (with minor configurations)")
-    print("CONFIDENCE: 95% - Application is well-architected and functional")
-    print("RISK LEVEL: LOW - Minor configuration changes needed for production")
-    
-    print("\n📝 RECOMMENDATIONS:")
-    print("1. Rotate JWT secret for production deployment")
-    print("2. Configure production-specific CORS origins")
-    print("3. Set up Redis for caching and session management")
-    print("4. Implement rate limiting for production")
-    print("5. Set up automated health monitoring")
-    print("6. Configure SSL termination at load balancer")
-    
-    print("="*100)
-    print("✅ COMPREHENSIVE VALIDATION COMPLETED SUCCESSFULLY")
-    print("="*100)
+    return "\n".join([
+        "\n" + "="*100,
+        "🚀 FINAL PRODUCTION READINESS REPORT",
+        "="*100,
+        f"Assessment Date: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}",
+        f"FastAPI Version: 0.115.x",
+        f"Application: FANZ FastAPI v0.1.0",
+        "-"*100,
+        
+        # Summary from comprehensive tests
+        "📊 COMPREHENSIVE TEST SUMMARY:",
+        "✅ Application Startup & Configuration: PASSED",
+        "✅ Health Check Endpoints: PASSED",
+        "✅ Authentication System (JWT): PASSED",
+        "⚠️  API Endpoints: MOSTLY PASSED (Database SSL issue fixed)",
+        "✅ CORS Configuration: PASSED",
+        "✅ Security Headers: PASSED",
+        "⚠️  WebSocket Functionality: STRUCTURE VALIDATED",
+        "✅ Database Configuration: PASSED",
+        "✅ Observability Features: PASSED",
+        
+        "\n🔧 TECHNICAL SPECIFICATIONS:",
+        "• Framework: FastAPI with async/await support",
+        "• Database: PostgreSQL with AsyncPG driver",
+        "• Authentication: JWT with HS256 algorithm",
+        "• Observability: OpenTelemetry + Prometheus metrics",
+        "• Logging: Structured logging with Loguru",
+        "• Security: CORS, security headers, request validation",
+        "• WebSocket: Real-time echo endpoint available",
+        
+        "\n⚡ PERFORMANCE METRICS:",
+        "• Health endpoint: < 50ms average response time",
+        "• JWT generation: < 100ms response time",
+        "• Memory usage: Optimized with connection pooling",
+        "• Async operations: Full async/await implementation",
+        
+        "\n🛡️ SECURITY ASSESSMENT:",
+        "✅ Security headers properly configured",
+        "✅ CORS policy configured for development/production",
+        "✅ JWT authentication with proper token structure",
+        "✅ Request validation with Pydantic models",
+        "⚠️  JWT secret should be rotated for production",
+        
+        "\n🔍 IDENTIFIED ISSUES & FIXES:",
+        "✅ FIXED: Database SSL connection parameter (sslmode → ssl)",
+        "✅ FIXED: Missing server configuration (host/port)",
+        "✅ FIXED: Missing dependencies (psycopg2-binary, httpx)",
+        "⚠️  TODO: Live WebSocket testing requires running server",
+        "⚠️  TODO: Production JWT secret rotation",
+        
+        "\n📋 PRODUCTION DEPLOYMENT CHECKLIST:",
+        "✅ Environment variables properly configured",
+        "✅ Database connection string validated",
+        "✅ Security headers implemented",
+        "✅ Health check endpoints working",
+        "✅ Logging and monitoring configured",
+        "⚠️  Generate production JWT secret",
+        "⚠️  Configure production CORS origins",
+        "⚠️  Set up production database with proper SSL",
+        "⚠️  Configure Redis for production caching",
+        "⚠️  Set up load balancer health checks",
+        
+        "\n🎯 OVERALL ASSESSMENT:",
+        "STATUS: ✅ PRODUCTION READY (with minor configurations)",
+        "CONFIDENCE: 95% - Application is well-architected and functional",
+        "RISK LEVEL: LOW - Minor configuration changes needed for production",
+        
+        "\n📝 RECOMMENDATIONS:",
+        "1. Rotate JWT secret for production deployment",
+        "2. Configure production-specific CORS origins",
+        "3. Set up Redis for caching and session management",
+        "4. Implement rate limiting for production",
+        "5. Set up automated health monitoring",
+        "6. Configure SSL termination at load balancer",
+        
+        "="*100,
+        "✅ COMPREHENSIVE VALIDATION COMPLETED SUCCESSFULLY",
+        "="*100,
+    ])
 
-def main():
+async def main():
     """Run final comprehensive validation."""
-    print("="*80)
-    print("🔍 FINAL PRODUCTION READINESS VALIDATION")
-    print("="*80)
-    print(f"Started at: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
-    print("-"*80)
-    
-    # Test database integration with fix
-    db_success = test_database_integration_fixed()
-    
-    print("-"*40)
-    
-    # Test WebSocket endpoint structure
-    ws_success = test_websocket_endpoint_structure()
-    
-    print("-"*40)
-    
-    # Test performance benchmarks
-    perf_success = test_performance_benchmarks()
+    # Everything is collected here and written to stdout once at the end
+    log = [
+        "="*80,
+        "🔍 FINAL PRODUCTION READINESS VALIDATION",
+        "="*80,
+        f"Started at: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}",
+        "-"*80,
+    ]
+    _report_lines.set(log)
     
-    print("-"*40)
-    
-    # Test error handling
-    error_success = test_error_handling()
-    
-    print("-"*40)
-    
-    # Test security configuration
-    security_success = test_security_configuration()
+    # One in-process ASGI client shared by every check
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+        # Independent HTTP checks run concurrently; their reports are logged in table order
+        results = await asyncio.gather(
+            *(run_buffered(check, client) for check in CONCURRENT_CHECKS)
+        )
+        for _, lines in results:
+            log.extend(lines)
+            log.append("-"*40)
+        
+        # Test WebSocket endpoint structure
+        ws_success = test_websocket_endpoint_structure()
+        
+        log.append("-"*40)
+        
+        # Test performance benchmarks; run alone so other traffic doesn't skew the timings
+        perf_success = await test_performance_benchmarks(client)
     
     # Generate final report
-    generate_production_readiness_report()
+    log.append(generate_production_readiness_report())
     
+    sys.stdout.write("\n".join(log) + "\n")
     return True
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    asyncio.run(main())
\ No newline at end of file
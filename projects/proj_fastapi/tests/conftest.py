@@ -1,13 +1,23 @@
 """Pytest configuration and shared fixtures for testing."""
 
 import asyncio
+import os
+
+import orjson
 import pytest
 import pytest_asyncio
+from pytest_asyncio import is_async_test
+from types import SimpleNamespace
 from typing import AsyncGenerator, Generator
-from httpx import AsyncClient
+from fastapi.testclient import TestClient
+from starlette.testclient import WebSocketTestSession
+from httpx import ASGITransport, AsyncClient, Response
+from sqlalchemy import event, insert
 from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
-from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
 
+from app.api.deps import get_db
+from app.core.auth import create_token_pair
 from app.core.config import settings
 from app.core.database import Base, get_database_session
 from app.core.redis import init_redis, close_redis, redis_manager
@@ -16,203 +26,466 @@ from app.main import create_app
 from app.models.user import User
 
 
-# Test database URL - use SQLite in memory for fast testing
-TEST_DATABASE_URL = "sqlite+aiosqlite:///./test.db"
+# Test database URL - use SQLite in memory for fast testing; under pytest-xdist every
+# worker is its own process, so each gets a private database
+TEST_DATABASE_URL = "sqlite+aiosqlite:///:memory:"
+
+# Redis is shared, so each xdist worker flushes only its own DB (1-15; 0 is left alone)
+XDIST_WORKER = os.environ.get("PYTEST_XDIST_WORKER", "gw0")
+TEST_REDIS_DB = 1 + int(XDIST_WORKER.removeprefix("gw")) % 15
 
 # Override settings for testing
 settings.testing = True
-settings.database_url_str = TEST_DATABASE_URL
-settings.redis_url_str = "redis://localhost:6379/1"  # Use different Redis DB
+settings.database_url = TEST_DATABASE_URL
+settings.redis_url = f"redis://localhost:6379/{TEST_REDIS_DB}"  # Use different Redis DB
 
+# Minimal Argon2 cost for tests; must be set before the hasher is first built
+settings.argon2_time_cost = 1
+settings.argon2_memory_cost = 128
+settings.argon2_parallelism = 1
 
-@pytest.fixture(scope="session")
-def event_loop() -> Generator:
-    """Create an instance of the default event loop for the test session."""
-    loop = asyncio.get_event_loop_policy().new_event_loop()
-    yield loop
-    loop.close()
+# Hash each fixture password once per run rather than once per test
+TEST_PASSWORD_HASH = password_manager.hash_password("testpassword123")
+ADMIN_PASSWORD_HASH = password_manager.hash_password("adminpassword123")
+INACTIVE_PASSWORD_HASH = password_manager.hash_password("inactivepassword123")
 
 
-@pytest_asyncio.fixture(scope="session")
+@pytest_asyncio.fixture(scope="session", loop_scope="session")
 async def engine():
     """Create test database engine."""
+    # StaticPool keeps the single in-memory connection alive and shared by every session
     engine = create_async_engine(
         TEST_DATABASE_URL,
         echo=False,
         future=True,
+        poolclass=StaticPool,
+        connect_args={"check_same_thread": False},
     )
     
+    # Let SQLAlchemy own BEGIN so SAVEPOINTs nest properly under pysqlite/aiosqlite
+    @event.listens_for(engine.sync_engine, "connect")
+    def disable_pysqlite_transactions(dbapi_connection, connection_record):
+        dbapi_connection.isolation_level = None
+    
+    @event.listens_for(engine.sync_engine, "begin")
+    def emit_begin(conn):
+        conn.exec_driver_sql("BEGIN")
+    
     # Create all tables
     async with engine.begin() as conn:
         await conn.run_sync(Base.metadata.create_all)
     
     yield engine
     
-    # Drop all tables and dispose engine
-    async with engine.begin() as conn:
-        await conn.run_sync(Base.metadata.drop_all)
+    # The in-memory database goes away with its connection
     await engine.dispose()
 
 
 @pytest_asyncio.fixture
 async def db_session(engine) -> AsyncGenerator[AsyncSession, None]:
-    """Create database session for testing."""
-    async_session = sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
+    """Create database session for testing.
     
-    async with async_session() as session:
-        yield session
-        await session.rollback()
-
-
-@pytest_asyncio.fixture
+    The session runs inside an outer transaction that is rolled back afterwards; its own
+    commits only release SAVEPOINTs, so every test starts from the same tables (empty apart
+    from the session-wide readonly_users).
+    """
+    async with engine.connect() as conn:
+        trans = await conn.begin()
+        session = AsyncSession(
+            bind=conn,
+            join_transaction_mode="create_savepoint",
+            expire_on_commit=False,
+        )
+        try:
+            yield session
+        finally:
+            await session.close()
+            await trans.rollback()
+
+
+@pytest_asyncio.fixture(scope="session", loop_scope="session")
 async def app():
     """Create FastAPI test application."""
     # Initialize Redis for testing
     await init_redis()
     
     app = create_app()
+    # Build and cache the OpenAPI schema once rather than in whichever test first needs it
+    app.openapi()
     yield app
     
     # Cleanup Redis
     await close_redis()
 
 
-@pytest_asyncio.fixture  
-async def client(app, db_session) -> AsyncGenerator[AsyncClient, None]:
-    """Create test HTTP client with database session override."""
+class ORJSONResponse(Response):
+    """httpx Response whose ``json()`` decodes with orjson."""
+    
+    def json(self, **kwargs):
+        return orjson.loads(self.content)
+
+
+class ORJSONAsyncClient(AsyncClient):
+    """AsyncClient that encodes request bodies and decodes responses with orjson."""
     
-    # Override database dependency
-    app.dependency_overrides[get_database_session] = lambda: db_session
+    def build_request(self, method, url, *, json=None, **kwargs):
+        if json is not None:
+            kwargs["content"] = orjson.dumps(json)
+            headers = kwargs.get("headers") or {}
+            kwargs["headers"] = {"Content-Type": "application/json", **headers}
+        return super().build_request(method, url, **kwargs)
     
-    async with AsyncClient(app=app, base_url="http://testserver") as ac:
+    async def send(self, request, **kwargs):
+        response = await super().send(request, **kwargs)
+        # Same object, narrower class: only json() changes, and only for this client
+        response.__class__ = ORJSONResponse
+        return response
+
+
+@pytest_asyncio.fixture(scope="session", loop_scope="session")
+async def client(app) -> AsyncGenerator[AsyncClient, None]:
+    """Create test HTTP client shared by the whole session."""
+    transport = ASGITransport(app=app)
+    async with ORJSONAsyncClient(
+        transport=transport, base_url="http://testserver", follow_redirects=False
+    ) as ac:
+        # Starlette builds the middleware stack on the first request; pay for it here,
+        # on a probe that touches neither the database nor Redis
+        await ac.get("/api/healthz")
         yield ac
+
+
+class ORJSONWebSocketSession(WebSocketTestSession):
+    """WebSocket test session that encodes and decodes JSON frames with orjson."""
+    
+    def send_json(self, data, mode="text"):
+        payload = orjson.dumps(data)
+        if mode == "text":
+            self.send({"type": "websocket.receive", "text": payload.decode()})
+        else:
+            self.send({"type": "websocket.receive", "bytes": payload})
     
-    # Clean up overrides
-    app.dependency_overrides.clear()
+    def receive_json(self, mode="text"):
+        message = self.receive()
+        self._raise_on_close(message)
+        return orjson.loads(message["text"] if mode == "text" else message["bytes"])
+
+
+class ORJSONTestClient(TestClient):
+    """TestClient whose WebSocket sessions use orjson for JSON frames."""
+    
+    def websocket_connect(self, url, subprotocols=None, **kwargs):
+        session = super().websocket_connect(url, subprotocols, **kwargs)
+        session.__class__ = ORJSONWebSocketSession
+        return session
+
+
+@pytest.fixture(scope="module")
+def ws_client(app) -> Generator[TestClient, None, None]:
+    """Started TestClient for WebSocket tests, so the lifespan runs once per module.
+    
+    TestClient serves the app from its own event loop in a second thread, and a Redis
+    connection only works on the loop that opened it. While this client is up, Redis is
+    connected from the client's loop instead, and the session-loop connection is put back
+    afterwards; tests in the same module must reach Redis only through this client.
+    """
+    session_redis = redis_manager.redis_client, redis_manager.connection_pool
+    with ORJSONTestClient(app) as test_client:
+        redis_manager.redis_client = redis_manager.connection_pool = None
+        test_client.portal.call(init_redis)
+        try:
+            # Pay for first-request setup here rather than in whichever test runs first
+            test_client.get("/api/v1/ws/health")
+            yield test_client
+        finally:
+            test_client.portal.call(redis_manager.redis_client.flushdb)
+            test_client.portal.call(close_redis)
+    redis_manager.redis_client, redis_manager.connection_pool = session_redis
+
+
+DB_DEPENDENCIES = (get_database_session, get_db)
+
+
+@pytest.fixture(autouse=True)
+def _override_db(request):
+    """Point the database dependency at this test's session.
+    
+    Tests marked ``cpu`` never reach the app or database, so they skip the setup entirely.
+    """
+    if request.node.get_closest_marker("cpu"):
+        yield
+        return
+    
+    app = request.getfixturevalue("app")
+    db_session = request.getfixturevalue("db_session")
+    lock = asyncio.Lock()
+    
+    async def override() -> AsyncGenerator[AsyncSession, None]:
+        # Requests a test fires concurrently share this one session, and an AsyncSession
+        # must not be used by two tasks at once, so they take turns
+        async with lock:
+            yield db_session
+    
+    # Routes depend on get_db, which opens its own session without going through Depends
+    for dependency in DB_DEPENDENCIES:
+        app.dependency_overrides[dependency] = override
+    yield
+    # Only drop our own overrides so other session-wide overrides survive
+    for dependency in DB_DEPENDENCIES:
+        app.dependency_overrides.pop(dependency, None)
+
+
+# Field values for the standard fixture users
+TEST_USER_DATA = {
+    "email": "test@example.com",
+    "username": "testuser",
+    "full_name": "Test User",
+    "hashed_password": TEST_PASSWORD_HASH,
+    "is_active": True,
+    "is_superuser": False,
+    "email_verified": True,
+}
+
+TEST_SUPERUSER_DATA = {
+    "email": "admin@example.com", 
+    "username": "admin",
+    "full_name": "Admin User",
+    "hashed_password": ADMIN_PASSWORD_HASH,
+    "is_active": True,
+    "is_superuser": True,
+    "email_verified": True,
+}
+
+INACTIVE_USER_DATA = {
+    "email": "inactive@example.com",
+    "username": "inactive",
+    "full_name": "Inactive User", 
+    "hashed_password": INACTIVE_PASSWORD_HASH,
+    "is_active": False,
+    "is_superuser": False,
+    "email_verified": True,
+}
+
+OAUTH_USER_DATA = {
+    "email": "oauth@example.com",
+    "username": "oauthuser",
+    "full_name": "OAuth User",
+    "hashed_password": None,  # OAuth user has no password
+    "is_active": True,
+    "is_superuser": False,
+    "email_verified": True,
+    "oauth_provider": "google",
+    "oauth_id": "google_123456",
+}
+
+
+async def insert_user(db_session: AsyncSession, data: dict) -> User:
+    """Insert a fixture user with INSERT ... RETURNING, skipping User.create's refresh query."""
+    user = await db_session.scalar(insert(User).values(**data).returning(User))
+    # Release the SAVEPOINT so a rollback inside the code under test keeps the fixture row
+    await db_session.commit()
+    return user
+
+
+async def insert_users(db_session: AsyncSession, rows: list[dict]) -> dict[str, User]:
+    """Insert several fixture users with one multi-row INSERT ... RETURNING, keyed by email."""
+    # A multi-VALUES insert needs the same columns in every row
+    columns = {key for row in rows for key in row}
+    values = [{key: row.get(key) for key in columns} for row in rows]
+    users = await db_session.scalars(insert(User).values(values).returning(User))
+    await db_session.commit()
+    return {user.email: user for user in users}
 
 
 @pytest_asyncio.fixture
 async def test_user(db_session: AsyncSession) -> User:
     """Create a test user."""
-    user_data = {
-        "email": "test@example.com",
-        "username": "testuser",
-        "full_name": "Test User",
-        "hashed_password": password_manager.hash_password("testpassword123"),
-        "is_active": True,
-        "is_superuser": False,
-        "email_verified": True,
-    }
-    
-    user = await User.create(db_session, **user_data)
-    return user
+    return await insert_user(db_session, TEST_USER_DATA)
 
 
 @pytest_asyncio.fixture
 async def test_superuser(db_session: AsyncSession) -> User:
     """Create a test superuser."""
-    user_data = {
-        "email": "admin@example.com", 
-        "username": "admin",
-        "full_name": "Admin User",
-        "hashed_password": password_manager.hash_password("adminpassword123"),
-        "is_active": True,
-        "is_superuser": True,
-        "email_verified": True,
-    }
-    
-    user = await User.create(db_session, **user_data)
-    return user
+    return await insert_user(db_session, TEST_SUPERUSER_DATA)
 
 
 @pytest_asyncio.fixture
 async def inactive_user(db_session: AsyncSession) -> User:
     """Create an inactive test user."""
-    user_data = {
-        "email": "inactive@example.com",
-        "username": "inactive",
-        "full_name": "Inactive User", 
-        "hashed_password": password_manager.hash_password("inactivepassword123"),
-        "is_active": False,
-        "is_superuser": False,
-        "email_verified": True,
-    }
-    
-    user = await User.create(db_session, **user_data)
-    return user
+    return await insert_user(db_session, INACTIVE_USER_DATA)
 
 
 @pytest_asyncio.fixture
 async def oauth_user(db_session: AsyncSession) -> User:
     """Create a test OAuth user."""
-    user_data = {
-        "email": "oauth@example.com",
-        "username": "oauthuser",
-        "full_name": "OAuth User",
-        "hashed_password": None,  # OAuth user has no password
-        "is_active": True,
-        "is_superuser": False,
-        "email_verified": True,
-        "oauth_provider": "google",
-        "oauth_id": "google_123456",
-    }
+    return await insert_user(db_session, OAUTH_USER_DATA)
+
+
+@pytest_asyncio.fixture
+async def standard_users(db_session: AsyncSession) -> dict[str, User]:
+    """Create the regular, super, inactive and OAuth users together.
     
-    user = await User.create(db_session, **user_data)
-    return user
+    For tests that need several of them: one multi-row INSERT and one commit instead of a
+    round-trip per fixture.
+    """
+    fixtures = {
+        "user": TEST_USER_DATA,
+        "superuser": TEST_SUPERUSER_DATA,
+        "inactive": INACTIVE_USER_DATA,
+        "oauth": OAUTH_USER_DATA,
+    }
+    by_email = await insert_users(db_session, list(fixtures.values()))
+    return {name: by_email[data["email"]] for name, data in fixtures.items()}
 
 
 @pytest_asyncio.fixture
-async def multiple_users(db_session: AsyncSession) -> list[User]:
-    """Create multiple test users for pagination testing."""
-    users = []
+async def multiple_users(db_session: AsyncSession) -> list[SimpleNamespace]:
+    """Create multiple test users for pagination testing.
     
-    for i in range(15):
-        user_data = {
+    Tests only count these and compare ids, so rows go in with one multi-row INSERT and come
+    back as ``RETURNING id`` stand-ins rather than tracked ORM instances.
+    """
+    rows = [
+        {
             "email": f"user{i}@example.com",
             "username": f"user{i}",
             "full_name": f"User {i}",
-            "hashed_password": password_manager.hash_password(f"password{i}"),
+            "hashed_password": TEST_PASSWORD_HASH,
             "is_active": True,
             "is_superuser": i == 0,  # First user is superuser
             "email_verified": True,
         }
-        
-        user = await User.create(db_session, **user_data)
-        users.append(user)
+        for i in range(15)
+    ]
+    
+    ids = await db_session.scalars(insert(User).values(rows).returning(User.id))
+    users = [SimpleNamespace(id=user_id) for user_id in ids]
+    await db_session.commit()
     
     return users
 
 
-# Authentication helpers
+# Users committed once for the whole run, for tests that only read
+READONLY_USERS_DATA = {
+    "active": {
+        "email": "reader@example.com",
+        "username": "reader",
+        "full_name": "Read-only User",
+        "hashed_password": TEST_PASSWORD_HASH,
+        "is_active": True,
+        "is_superuser": False,
+        "email_verified": True,
+    },
+    "inactive": {
+        "email": "reader-inactive@example.com",
+        "username": "reader_inactive",
+        "full_name": "Read-only Inactive User",
+        "hashed_password": INACTIVE_PASSWORD_HASH,
+        "is_active": False,
+        "is_superuser": False,
+        "email_verified": True,
+    },
+    "admin": {
+        "email": "reader-admin@example.com",
+        "username": "reader_admin",
+        "full_name": "Read-only Admin",
+        "hashed_password": ADMIN_PASSWORD_HASH,
+        "is_active": True,
+        "is_superuser": True,
+        "email_verified": True,
+    },
+}
 
-@pytest_asyncio.fixture
-async def user_token(client: AsyncClient, test_user: User) -> str:
-    """Get authentication token for test user."""
-    login_data = {
-        "email": test_user.email,
-        "password": "testpassword123"
-    }
+
+@pytest_asyncio.fixture(scope="session", loop_scope="session")
+async def readonly_users(engine) -> dict[str, SimpleNamespace]:
+    """Active, inactive and admin users inserted once per run.
     
-    response = await client.post("/api/v1/auth/login", json=login_data)
-    assert response.status_code == 200
+    The rows are committed outside every test's rolled-back transaction, so tests must only
+    read them; anything that writes to a user takes the per-test fixtures instead.
+    """
+    users = User.__table__
+    async with engine.begin() as conn:
+        result = await conn.execute(
+            insert(users).values(list(READONLY_USERS_DATA.values())).returning(users)
+        )
+        by_email = {row.email: SimpleNamespace(**row._mapping) for row in result}
+    return {name: by_email[data["email"]] for name, data in READONLY_USERS_DATA.items()}
+
+
+# Authentication helpers
+
+def issue_tokens(user: User | SimpleNamespace) -> dict:
+    """Token pair for a fixture user, minted directly instead of through a login round-trip.
     
-    token_data = response.json()
-    return token_data["access_token"]
+    Carries the same claims /auth/login issues, without its password verify and session write.
+    """
+    return create_token_pair(
+        user.id,
+        additional_data={
+            "email": user.email,
+            "username": user.username,
+            "is_superuser": user.is_superuser,
+        },
+    )
 
 
-@pytest_asyncio.fixture
-async def superuser_token(client: AsyncClient, test_superuser: User) -> str:
+@pytest.fixture
+def login_tokens(test_user: User) -> dict:
+    """Token pair for the test user. Function-scoped because test_user is."""
+    return issue_tokens(test_user)
+
+
+@pytest.fixture
+def user_token(login_tokens: dict) -> str:
+    """Get authentication token for test user."""
+    return login_tokens["access_token"]
+
+
+@pytest.fixture
+def user_auth_headers(user_token: str) -> dict:
+    """Authorization headers for the test user."""
+    return auth_headers(user_token)
+
+
+@pytest.fixture
+def superuser_token(test_superuser: User) -> str:
     """Get authentication token for test superuser."""
-    login_data = {
-        "email": test_superuser.email,
-        "password": "adminpassword123"
+    return issue_tokens(test_superuser)["access_token"]
+
+
+@pytest.fixture
+def superuser_auth_headers(superuser_token: str) -> dict:
+    """Authorization headers for the test superuser."""
+    return auth_headers(superuser_token)
+
+
+# WebSocket auth reads identity from the token claims alone, so these tokens need no user row
+WS_USER = SimpleNamespace(id=1, email="ws@test.com", username="wsuser", is_superuser=False)
+WS_SUPERUSER = SimpleNamespace(
+    id=2, email="ws-admin@test.com", username="wsadmin", is_superuser=True
+)
+
+
+@pytest.fixture(scope="session")
+def ws_user_token() -> str:
+    """Access token for WebSocket tests, minted once per run."""
+    return issue_tokens(WS_USER)["access_token"]
+
+
+@pytest.fixture(scope="session")
+def ws_superuser_token() -> str:
+    """Superuser access token for WebSocket tests, minted once per run."""
+    return issue_tokens(WS_SUPERUSER)["access_token"]
+
+
+@pytest.fixture
+def readonly_headers(readonly_users: dict[str, SimpleNamespace]) -> dict[str, dict]:
+    """Authorization headers for each read-only user, by the same keys as readonly_users."""
+    return {
+        name: auth_headers(issue_tokens(user)["access_token"])
+        for name, user in readonly_users.items()
     }
-    
-    response = await client.post("/api/v1/auth/login", json=login_data)
-    assert response.status_code == 200
-    
-    token_data = response.json()
-    return token_data["access_token"]
 
 
 def auth_headers(token: str) -> dict:
@@ -277,6 +550,14 @@ def invalid_login_data() -> dict:
 pytest_plugins = ["pytest_asyncio"]
 
 
+def pytest_collection_modifyitems(items):
+    """Run every async test on the session loop shared with the app and engine fixtures."""
+    session_loop = pytest.mark.asyncio(loop_scope="session")
+    for item in items:
+        if is_async_test(item):
+            item.add_marker(session_loop, append=False)
+
+
 def pytest_configure(config):
     """Configure pytest with custom markers."""
     config.addinivalue_line(
@@ -288,15 +569,29 @@ def pytest_configure(config):
     config.addinivalue_line(
         "markers", "slow: marks tests as slow (deselect with '-m \"not slow\"')"
     )
+    config.addinivalue_line(
+        "markers", "redis: test uses Redis directly; its data is flushed afterwards"
+    )
 
 
 # Cleanup
 
+# Fixtures through which a test can write to Redis
+REDIS_FIXTURES = frozenset({"client", "redis_client"})
+
+
 @pytest_asyncio.fixture(autouse=True)
-async def cleanup_redis():
-    """Clean up Redis data after each test."""
+async def cleanup_redis(request):
+    """Clean up Redis data after each test that can reach it."""
     yield
     
+    # Skip the FLUSHDB round-trip for tests that never touch Redis
+    if not (
+        request.node.get_closest_marker("redis")
+        or REDIS_FIXTURES.intersection(request.fixturenames)
+    ):
+        return
+    
     # Clear Redis test database after each test
     if redis_manager.redis_client:
         await redis_manager.redis_client.flushdb()
@@ -0,0 +1,32 @@
+"""OpenAPI document tests."""
+
+from httpx import AsyncClient
+
+from app.schemas._examples import SCHEMA_DESCRIPTIONS, SCHEMA_EXAMPLES
+
+
+def schemas_named(components: dict, name: str) -> list[dict]:
+    """Component schemas generated for a model, including any -Input/-Output split."""
+    keys = (name, f"{name}-Input", f"{name}-Output")
+    return [schema for key, schema in components.items() if key in keys]
+
+
+async def test_openapi_carries_examples(client: AsyncClient):
+    """Test that the served document has every example and field description attached."""
+    response = await client.get("/openapi.json")
+    
+    assert response.status_code == 200
+    components = response.json()["components"]["schemas"]
+    
+    for name, example in SCHEMA_EXAMPLES.items():
+        schemas = schemas_named(components, name)
+        assert schemas, name
+        for schema in schemas:
+            assert schema["example"] == example
+    
+    for name, descriptions in SCHEMA_DESCRIPTIONS.items():
+        schemas = schemas_named(components, name)
+        assert schemas, name
+        for schema in schemas:
+            for field, description in descriptions.items():
+                assert schema["properties"][field]["description"] == description
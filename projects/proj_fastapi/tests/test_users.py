@@ -1,11 +1,29 @@
 """User management API tests."""
 
+import asyncio
+
 import pytest
 from httpx import AsyncClient
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.models.user import User
-from tests.conftest import auth_headers
+
+# Routes are pinned exactly as mounted (list with a trailing slash, items without) so no
+# request ever depends on a redirect
+USERS_URL = "/api/v1/users/"
+USER_URL = USERS_URL + "{id}"
+PROFILE_URL = USERS_URL + "me/profile"
+
+# Keys every list page and every single-user response must carry
+EXPECTED_LIST_KEYS = frozenset(("users", "total", "page", "size", "pages"))
+EXPECTED_USER_KEYS = frozenset(
+    ("id", "email", "username", "full_name", "is_active", "is_superuser", "email_verified")
+)
+
+
+def user_url(user_id: int) -> str:
+    """URL of a single user."""
+    return USER_URL.format(id=user_id)
 
 
 class TestGetUsers:
@@ -14,35 +32,33 @@ class TestGetUsers:
     async def test_get_users_as_admin(
         self,
         client: AsyncClient,
-        superuser_token: str,
-        multiple_users: list[User]
+        superuser_auth_headers: dict,
+        multiple_users: list
     ):
         """Test getting user list as admin."""
-        headers = auth_headers(superuser_token)
-        response = await client.get("/api/v1/users/", headers=headers)
+        response = await client.get(USERS_URL, headers=superuser_auth_headers)
         
         assert response.status_code == 200
         data = response.json()
         
-        assert "users" in data
-        assert "total" in data
-        assert "page" in data
-        assert "size" in data
-        assert "pages" in data
+        assert EXPECTED_LIST_KEYS <= data.keys()
         assert data["total"] >= len(multiple_users)
         assert len(data["users"]) <= data["size"]
     
     async def test_get_users_with_pagination(
         self,
         client: AsyncClient,
-        superuser_token: str,
-        multiple_users: list[User]
+        superuser_auth_headers: dict,
+        multiple_users: list
     ):
         """Test user list pagination."""
-        headers = auth_headers(superuser_token)
+        # Both pages are read-only, so fetch them together
+        response1, response2 = await asyncio.gather(
+            client.get(f"{USERS_URL}?page=1&size=5", headers=superuser_auth_headers),
+            client.get(f"{USERS_URL}?page=2&size=5", headers=superuser_auth_headers),
+        )
         
         # First page
-        response1 = await client.get("/api/v1/users/?page=1&size=5", headers=headers)
         assert response1.status_code == 200
         
         data1 = response1.json()
@@ -51,7 +67,6 @@ class TestGetUsers:
         assert len(data1["users"]) <= 5
         
         # Second page
-        response2 = await client.get("/api/v1/users/?page=2&size=5", headers=headers)
         assert response2.status_code == 200
         
         data2 = response2.json()
@@ -65,60 +80,39 @@ class TestGetUsers:
     async def test_get_users_with_search(
         self,
         client: AsyncClient,
-        superuser_token: str,
-        test_user: User
+        readonly_users: dict,
+        readonly_headers: dict
     ):
         """Test user search functionality."""
-        headers = auth_headers(superuser_token)
-        response = await client.get(f"/api/v1/users/?search={test_user.username}", headers=headers)
+        user = readonly_users["active"]
+        response = await client.get(
+            f"{USERS_URL}?search={user.username}", headers=readonly_headers["admin"]
+        )
         
         assert response.status_code == 200
         data = response.json()
         
         # Should find the user
-        user_ids = [user["id"] for user in data["users"]]
-        assert test_user.id in user_ids
+        assert any(found["id"] == user.id for found in data["users"])
     
     async def test_get_users_with_filters(
         self,
         client: AsyncClient,
-        superuser_token: str,
-        inactive_user: User
+        readonly_users: dict,
+        readonly_headers: dict
     ):
         """Test user list filtering."""
-        headers = auth_headers(superuser_token)
-        
         # Filter by active status
-        response = await client.get("/api/v1/users/?is_active=false", headers=headers)
+        response = await client.get(
+            f"{USERS_URL}?is_active=false", headers=readonly_headers["admin"]
+        )
         assert response.status_code == 200
         
         data = response.json()
-        inactive_user_ids = [user["id"] for user in data["users"]]
-        assert inactive_user.id in inactive_user_ids
+        assert any(user["id"] == readonly_users["inactive"].id for user in data["users"])
         
         # All returned users should be inactive
-        for user in data["users"]:
-            assert user["is_active"] is False
-    
-    async def test_get_users_as_regular_user(
-        self,
-        client: AsyncClient,
-        user_token: str
-    ):
-        """Test that regular users cannot access user list."""
-        headers = auth_headers(user_token)
-        response = await client.get("/api/v1/users/", headers=headers)
-        
-        assert response.status_code == 403
-    
-    async def test_get_users_without_auth(
-        self,
-        client: AsyncClient
-    ):
-        """Test that unauthenticated users cannot access user list."""
-        response = await client.get("/api/v1/users/")
-        
-        assert response.status_code == 403
+        assert all(user["is_active"] is False for user in data["users"])
 
 
 class TestGetUser:
@@ -127,55 +121,29 @@ class TestGetUser:
     async def test_get_own_user(
         self,
         client: AsyncClient,
-        test_user: User,
-        user_token: str
+        readonly_users: dict,
+        readonly_headers: dict
     ):
         """Test getting own user profile."""
-        headers = auth_headers(user_token)
-        response = await client.get(f"/api/v1/users/{test_user.id}", headers=headers)
-        
-        assert response.status_code == 200
-        data = response.json()
-        
-        assert data["id"] == test_user.id
-        assert data["email"] == test_user.email
-        assert data["username"] == test_user.username
-        assert data["full_name"] == test_user.full_name
-    
-    async def test_get_other_user_as_admin(
-        self,
-        client: AsyncClient,
-        test_user: User,
-        superuser_token: str
-    ):
-        """Test admin getting another user's profile."""
-        headers = auth_headers(superuser_token)
-        response = await client.get(f"/api/v1/users/{test_user.id}", headers=headers)
+        user = readonly_users["active"]
+        response = await client.get(user_url(user.id), headers=readonly_headers["active"])
         
         assert response.status_code == 200
         data = response.json()
-        assert data["id"] == test_user.id
-    
-    async def test_get_other_user_as_regular_user(
-        self,
-        client: AsyncClient,
-        test_superuser: User,
-        user_token: str
-    ):
-        """Test regular user trying to get another user's profile."""
-        headers = auth_headers(user_token)
-        response = await client.get(f"/api/v1/users/{test_superuser.id}", headers=headers)
         
-        assert response.status_code == 403
+        assert EXPECTED_USER_KEYS <= data.keys()
+        assert data["id"] == user.id
+        assert data["email"] == user.email
+        assert data["username"] == user.username
+        assert data["full_name"] == user.full_name
     
     async def test_get_nonexistent_user(
         self,
         client: AsyncClient,
-        superuser_token: str
+        readonly_headers: dict
     ):
         """Test getting non-existent user."""
-        headers = auth_headers(superuser_token)
-        response = await client.get("/api/v1/users/99999", headers=headers)
+        response = await client.get(user_url(99999), headers=readonly_headers["admin"])
         
         assert response.status_code == 404
 
@@ -186,7 +154,7 @@ class TestCreateUser:
     async def test_create_user_as_admin(
         self,
         client: AsyncClient,
-        superuser_token: str
+        superuser_auth_headers: dict
     ):
         """Test creating user as admin."""
         user_data = {
@@ -199,8 +167,7 @@ class TestCreateUser:
             "email_verified": True
         }
         
-        headers = auth_headers(superuser_token)
-        response = await client.post("/api/v1/users/", json=user_data, headers=headers)
+        response = await client.post(USERS_URL, json=user_data, headers=superuser_auth_headers)
         
         assert response.status_code == 201
         data = response.json()
@@ -217,7 +184,7 @@ class TestCreateUser:
         self,
         client: AsyncClient,
         test_user: User,
-        superuser_token: str
+        superuser_auth_headers: dict
     ):
         """Test creating user with duplicate email."""
         user_data = {
@@ -226,8 +193,7 @@ class TestCreateUser:
             "password": "Password123!"
         }
         
-        headers = auth_headers(superuser_token)
-        response = await client.post("/api/v1/users/", json=user_data, headers=headers)
+        response = await client.post(USERS_URL, json=user_data, headers=superuser_auth_headers)
         
         assert response.status_code == 400
         assert "already registered" in response.json()["detail"]
@@ -235,7 +201,7 @@ class TestCreateUser:
     async def test_create_user_as_regular_user(
         self,
         client: AsyncClient,
-        user_token: str
+        user_auth_headers: dict
     ):
         """Test that regular users cannot create users."""
         user_data = {
@@ -244,8 +210,7 @@ class TestCreateUser:
             "password": "Password123!"
         }
         
-        headers = auth_headers(user_token)
-        response = await client.post("/api/v1/users/", json=user_data, headers=headers)
+        response = await client.post(USERS_URL, json=user_data, headers=user_auth_headers)
         
         assert response.status_code == 403
 
@@ -257,7 +222,7 @@ class TestUpdateUser:
         self,
         client: AsyncClient,
         test_user: User,
-        user_token: str
+        user_auth_headers: dict
     ):
         """Test user updating their own profile."""
         update_data = {
@@ -265,8 +230,9 @@ class TestUpdateUser:
             "username": "updated_username"
         }
         
-        headers = auth_headers(user_token)
-        response = await client.put(f"/api/v1/users/{test_user.id}", json=update_data, headers=headers)
+        response = await client.put(
+            user_url(test_user.id), json=update_data, headers=user_auth_headers
+        )
         
         assert response.status_code == 200
         data = response.json()
@@ -279,7 +245,7 @@ class TestUpdateUser:
         self,
         client: AsyncClient,
         test_user: User,
-        superuser_token: str
+        superuser_auth_headers: dict
     ):
         """Test admin updating any user."""
         update_data = {
@@ -288,8 +254,9 @@ class TestUpdateUser:
             "is_superuser": True
         }
         
-        headers = auth_headers(superuser_token)
-        response = await client.put(f"/api/v1/users/{test_user.id}", json=update_data, headers=headers)
+        response = await client.put(
+            user_url(test_user.id), json=update_data, headers=superuser_auth_headers
+        )
         
         assert response.status_code == 200
         data = response.json()
@@ -302,7 +269,7 @@ class TestUpdateUser:
         self,
         client: AsyncClient,
         test_user: User,
-        user_token: str
+        user_auth_headers: dict
     ):
         """Test that regular users cannot change admin-only fields."""
         update_data = {
@@ -311,8 +278,9 @@ class TestUpdateUser:
             "email": "hacked@example.com"
         }
         
-        headers = auth_headers(user_token)
-        response = await client.put(f"/api/v1/users/{test_user.id}", json=update_data, headers=headers)
+        response = await client.put(
+            user_url(test_user.id), json=update_data, headers=user_auth_headers
+        )
         
         assert response.status_code == 200
         data = response.json()
@@ -322,47 +290,58 @@ class TestUpdateUser:
         assert data["is_active"] == test_user.is_active
         assert data["email"] == test_user.email
     
-    async def test_admin_cannot_deactivate_self(
+    async def test_explicit_null_clears_full_name(
         self,
         client: AsyncClient,
-        test_superuser: User,
-        superuser_token: str
+        test_user: User,
+        user_auth_headers: dict
     ):
-        """Test that admin cannot deactivate their own account."""
-        update_data = {"is_active": False}
+        """Test that null clears a nullable field and is ignored for a required one."""
+        update_data = {"full_name": None, "username": None}
         
-        headers = auth_headers(superuser_token)
-        response = await client.put(f"/api/v1/users/{test_superuser.id}", json=update_data, headers=headers)
+        response = await client.put(
+            user_url(test_user.id), json=update_data, headers=user_auth_headers
+        )
         
-        assert response.status_code == 400
-        assert "Cannot deactivate" in response.json()["detail"]
+        assert response.status_code == 200
+        data = response.json()
+        
+        assert data["full_name"] is None
+        assert data["username"] == test_user.username
     
-    async def test_admin_cannot_remove_own_superuser_status(
+    async def test_update_avatar_url(
         self,
         client: AsyncClient,
-        test_superuser: User,
-        superuser_token: str
+        test_user: User,
+        user_auth_headers: dict
     ):
-        """Test that admin cannot remove their own superuser status."""
-        update_data = {"is_superuser": False}
+        """Test that a user can set and then clear their avatar URL."""
+        url = user_url(test_user.id)
         
-        headers = auth_headers(superuser_token)
-        response = await client.put(f"/api/v1/users/{test_superuser.id}", json=update_data, headers=headers)
+        response = await client.put(
+            url, json={"avatar_url": "https://example.com/a.png"}, headers=user_auth_headers
+        )
         
-        assert response.status_code == 400
-        assert "Cannot remove" in response.json()["detail"]
+        assert response.status_code == 200
+        assert response.json()["avatar_url"] == "https://example.com/a.png"
+        
+        response = await client.put(url, json={"avatar_url": None}, headers=user_auth_headers)
+        
+        assert response.status_code == 200
+        assert response.json()["avatar_url"] is None
     
     async def test_update_other_user_as_regular_user(
         self,
         client: AsyncClient,
         test_superuser: User,
-        user_token: str
+        user_auth_headers: dict
     ):
         """Test regular user trying to update another user."""
         update_data = {"full_name": "Hacked Name"}
         
-        headers = auth_headers(user_token)
-        response = await client.put(f"/api/v1/users/{test_superuser.id}", json=update_data, headers=headers)
+        response = await client.put(
+            user_url(test_superuser.id), json=update_data, headers=user_auth_headers
+        )
         
         assert response.status_code == 403
 
@@ -373,43 +352,107 @@ class TestDeleteUser:
     async def test_delete_user_as_admin(
         self,
         client: AsyncClient,
+        db_session: AsyncSession,
         test_user: User,
-        superuser_token: str
+        superuser_auth_headers: dict
     ):
         """Test admin deleting a user."""
-        headers = auth_headers(superuser_token)
-        response = await client.delete(f"/api/v1/users/{test_user.id}", headers=headers)
+        response = await client.delete(user_url(test_user.id), headers=superuser_auth_headers)
         
         assert response.status_code == 204
         
         # Verify user is deleted
-        get_response = await client.get(f"/api/v1/users/{test_user.id}", headers=headers)
-        assert get_response.status_code == 404
+        db_session.expire_all()
+        assert await db_session.get(User, test_user.id) is None
+
+
+# (method, URL template, (target user fixture, headers fixture), expected status)
+PERMISSION_CASES = [
+    pytest.param("get", USERS_URL, (None, "user_auth_headers"), 403, id="list-as-user"),
+    pytest.param("get", USERS_URL, (None, None), 403, id="list-without-auth"),
+    pytest.param(
+        "get", USER_URL, ("test_user", "superuser_auth_headers"), 200,
+        id="get-other-as-admin",
+    ),
+    pytest.param(
+        "get", USER_URL, ("test_superuser", "user_auth_headers"), 403,
+        id="get-other-as-user",
+    ),
+    pytest.param(
+        "delete", USER_URL, ("test_user", "user_auth_headers"), 403,
+        id="delete-as-user",
+    ),
+]
+
+
+@pytest.fixture
+def permission_subject(request):
+    """Resolve the target user and auth headers a permission case names."""
+    target_fixture, headers_fixture = request.param
+    target = request.getfixturevalue(target_fixture) if target_fixture else None
+    headers = request.getfixturevalue(headers_fixture) if headers_fixture else {}
+    return target, headers
+
+
+class TestUserPermissions:
+    """Test who may list, read and delete users."""
     
-    async def test_admin_cannot_delete_self(
+    @pytest.mark.parametrize(
+        "method,url,permission_subject,expected_status",
+        PERMISSION_CASES,
+        indirect=["permission_subject"],
+    )
+    async def test_permission_matrix(
         self,
         client: AsyncClient,
-        test_superuser: User,
-        superuser_token: str
+        method: str,
+        url: str,
+        permission_subject,
+        expected_status: int
     ):
-        """Test that admin cannot delete their own account."""
-        headers = auth_headers(superuser_token)
-        response = await client.delete(f"/api/v1/users/{test_superuser.id}", headers=headers)
+        """Test that each caller gets the expected status for each user endpoint."""
+        target, headers = permission_subject
+        if target is not None:
+            url = url.format(id=target.id)
         
-        assert response.status_code == 400
-        assert "Cannot delete" in response.json()["detail"]
+        response = await client.request(method.upper(), url, headers=headers)
+        
+        assert response.status_code == expected_status
+
+
+# (method, path suffix, JSON body, expected detail substring)
+SELF_MODIFICATION_CASES = [
+    pytest.param("put", "", {"is_active": False}, "Cannot deactivate", id="update-deactivate"),
+    pytest.param("put", "", {"is_superuser": False}, "Cannot remove", id="update-drop-superuser"),
+    pytest.param("delete", "", None, "Cannot delete", id="delete"),
+    pytest.param("post", "/deactivate", None, "Cannot deactivate", id="deactivate"),
+]
+
+
+class TestAdminSelfProtection:
+    """Test that admins cannot lock themselves out."""
     
-    async def test_delete_user_as_regular_user(
+    @pytest.mark.parametrize("method,path_suffix,payload,expected_detail", SELF_MODIFICATION_CASES)
+    async def test_admin_cannot_modify_self(
         self,
         client: AsyncClient,
-        test_user: User,
-        user_token: str
+        test_superuser: User,
+        superuser_auth_headers: dict,
+        method: str,
+        path_suffix: str,
+        payload: dict | None,
+        expected_detail: str
     ):
-        """Test that regular users cannot delete users."""
-        headers = auth_headers(user_token)
-        response = await client.delete(f"/api/v1/users/{test_user.id}", headers=headers)
+        """Test that an admin cannot deactivate, demote or delete their own account."""
+        response = await client.request(
+            method.upper(),
+            f"{user_url(test_superuser.id)}{path_suffix}",
+            json=payload,
+            headers=superuser_auth_headers,
+        )
         
-        assert response.status_code == 403
+        assert response.status_code == 400
+        assert expected_detail in response.json()["detail"]
 
 
 class TestUserProfileUpdate:
@@ -419,7 +462,7 @@ class TestUserProfileUpdate:
         self,
         client: AsyncClient,
         test_user: User,
-        user_token: str
+        user_auth_headers: dict
     ):
         """Test user updating their own profile."""
         profile_data = {
@@ -427,8 +470,7 @@ class TestUserProfileUpdate:
             "username": "updated_user"
         }
         
-        headers = auth_headers(user_token)
-        response = await client.put("/api/v1/users/me/profile", json=profile_data, headers=headers)
+        response = await client.put(PROFILE_URL, json=profile_data, headers=user_auth_headers)
         
         assert response.status_code == 200
         data = response.json()
@@ -436,18 +478,74 @@ class TestUserProfileUpdate:
         assert data["full_name"] == profile_data["full_name"]
         assert data["username"] == profile_data["username"]
     
+    async def test_update_profile_omitted_fields_unchanged(
+        self,
+        client: AsyncClient,
+        test_user: User,
+        user_auth_headers: dict
+    ):
+        """Test that only the fields sent are changed, and null clears them."""
+        response = await client.put(
+            PROFILE_URL, json={"username": "renamed_user"}, headers=user_auth_headers
+        )
+        
+        assert response.status_code == 200
+        assert response.json()["full_name"] == test_user.full_name
+        
+        response = await client.put(
+            PROFILE_URL, json={"full_name": None}, headers=user_auth_headers
+        )
+        
+        assert response.status_code == 200
+        data = response.json()
+        
+        assert data["full_name"] is None
+        assert data["username"] == "renamed_user"
+    
+    async def test_update_profile_text_fields_sanitized(
+        self,
+        client: AsyncClient,
+        test_user: User,
+        user_auth_headers: dict
+    ):
+        """Test that profile text is sanitized on the way in and null clears it."""
+        profile_data = {
+            "bio": "  Line one\nLine two\x00\x07  ",
+            "location": "\tBerlin ",
+            "website": "https://example.com"
+        }
+        
+        response = await client.put(PROFILE_URL, json=profile_data, headers=user_auth_headers)
+        
+        assert response.status_code == 200
+        data = response.json()
+        
+        assert data["bio"] == "Line one\nLine two"
+        assert data["location"] == "Berlin"
+        assert data["website"] == "https://example.com"
+        
+        response = await client.put(
+            PROFILE_URL, json={"bio": None, "location": "   "}, headers=user_auth_headers
+        )
+        
+        assert response.status_code == 200
+        data = response.json()
+        
+        assert data["bio"] is None
+        assert data["location"] is None
+        assert data["website"] == "https://example.com"
+    
     async def test_update_profile_duplicate_username(
         self,
         client: AsyncClient,
         test_user: User,
         test_superuser: User,
-        user_token: str
+        user_auth_headers: dict
     ):
         """Test updating profile with existing username."""
         profile_data = {"username": test_superuser.username}
         
-        headers = auth_headers(user_token)
-        response = await client.put("/api/v1/users/me/profile", json=profile_data, headers=headers)
+        response = await client.put(PROFILE_URL, json=profile_data, headers=user_auth_headers)
         
         assert response.status_code == 400
         assert "already taken" in response.json()["detail"]
@@ -460,11 +558,12 @@ class TestUserActivation:
         self,
         client: AsyncClient,
         inactive_user: User,
-        superuser_token: str
+        superuser_auth_headers: dict
     ):
         """Test activating an inactive user."""
-        headers = auth_headers(superuser_token)
-        response = await client.post(f"/api/v1/users/{inactive_user.id}/activate", headers=headers)
+        response = await client.post(
+            f"{user_url(inactive_user.id)}/activate", headers=superuser_auth_headers
+        )
         
         assert response.status_code == 200
         data = response.json()
@@ -475,29 +574,17 @@ class TestUserActivation:
         self,
         client: AsyncClient,
         test_user: User,
-        superuser_token: str
+        superuser_auth_headers: dict
     ):
         """Test deactivating an active user."""
-        headers = auth_headers(superuser_token)
-        response = await client.post(f"/api/v1/users/{test_user.id}/deactivate", headers=headers)
+        response = await client.post(
+            f"{user_url(test_user.id)}/deactivate", headers=superuser_auth_headers
+        )
         
         assert response.status_code == 200
         data = response.json()
         
         assert data["is_active"] is False
-    
-    async def test_admin_cannot_deactivate_self(
-        self,
-        client: AsyncClient,
-        test_superuser: User,
-        superuser_token: str
-    ):
-        """Test that admin cannot deactivate themselves."""
-        headers = auth_headers(superuser_token)
-        response = await client.post(f"/api/v1/users/{test_superuser.id}/deactivate", headers=headers)
-        
-        assert response.status_code == 400
-        assert "Cannot deactivate" in response.json()["detail"]
 
 
 @pytest.mark.integration
@@ -507,11 +594,10 @@ class TestUserCRUDFlow:
     async def test_complete_user_lifecycle(
         self,
         client: AsyncClient,
-        superuser_token: str
+        db_session: AsyncSession,
+        superuser_auth_headers: dict
     ):
         """Test complete user create-read-update-delete flow."""
-        headers = auth_headers(superuser_token)
-        
         # 1. Create user
         create_data = {
             "email": "lifecycle@example.com",
@@ -521,43 +607,50 @@ class TestUserCRUDFlow:
             "is_active": True
         }
         
-        create_response = await client.post("/api/v1/users/", json=create_data, headers=headers)
+        create_response = await client.post(
+            USERS_URL, json=create_data, headers=superuser_auth_headers
+        )
         assert create_response.status_code == 201
         user_data = create_response.json()
         user_id = user_data["id"]
+        url = user_url(user_id)
         
-        # 2. Read user
-        get_response = await client.get(f"/api/v1/users/{user_id}", headers=headers)
-        assert get_response.status_code == 200
-        assert get_response.json()["email"] == create_data["email"]
+        # The create response already carries the stored user, so no separate read is needed
+        assert user_data["email"] == create_data["email"]
         
-        # 3. Update user
+        # 2. Update user
         update_data = {
             "full_name": "Updated Lifecycle User",
             "is_superuser": True
         }
         
-        update_response = await client.put(f"/api/v1/users/{user_id}", json=update_data, headers=headers)
+        update_response = await client.put(
+            url, json=update_data, headers=superuser_auth_headers
+        )
         assert update_response.status_code == 200
         
         updated_data = update_response.json()
         assert updated_data["full_name"] == update_data["full_name"]
         assert updated_data["is_superuser"] is True
         
-        # 4. Deactivate user
-        deactivate_response = await client.post(f"/api/v1/users/{user_id}/deactivate", headers=headers)
+        # 3. Deactivate user
+        deactivate_response = await client.post(
+            f"{url}/deactivate", headers=superuser_auth_headers
+        )
         assert deactivate_response.status_code == 200
         assert deactivate_response.json()["is_active"] is False
         
-        # 5. Reactivate user
-        activate_response = await client.post(f"/api/v1/users/{user_id}/activate", headers=headers)
+        # 4. Reactivate user
+        activate_response = await client.post(
+            f"{url}/activate", headers=superuser_auth_headers
+        )
         assert activate_response.status_code == 200
         assert activate_response.json()["is_active"] is True
         
-        # 6. Delete user
-        delete_response = await client.delete(f"/api/v1/users/{user_id}", headers=headers)
+        # 5. Delete user
+        delete_response = await client.delete(url, headers=superuser_auth_headers)
         assert delete_response.status_code == 204
         
-        # 7. Verify user is deleted
-        final_get_response = await client.get(f"/api/v1/users/{user_id}", headers=headers)
-        assert final_get_response.status_code == 404
\ No newline at end of file
+        # 6. Verify user is deleted
+        db_session.expire_all()
+        assert await db_session.get(User, user_id) is None
\ No newline at end of file
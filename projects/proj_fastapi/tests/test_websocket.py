@@ -1,274 +1,181 @@
 """WebSocket API tests."""
 
-import json
+from contextlib import ExitStack, contextmanager
+from typing import Iterator
+
+import orjson
 import pytest
-from httpx import AsyncClient
+from fastapi import status
 from fastapi.testclient import TestClient
-from fastapi.websockets import WebSocket
+from starlette.testclient import WebSocketTestSession
+from fastapi.websockets import WebSocketDisconnect
 
+from app.api.websocket import manager
 from app.models.user import User
 
+# Encoded once at import; the throughput test sends it 120 times
+PING_FRAME = orjson.dumps({"type": "ping"}).decode()
+
+
+@contextmanager
+def connected(ws_client: TestClient, token: str) -> Iterator[WebSocketTestSession]:
+    """Open a WebSocket connection and read past its welcome and stats frames."""
+    with ws_client.websocket_connect(f"/api/v1/ws/connect?token={token}") as websocket:
+        websocket.receive_json()  # welcome
+        websocket.receive_json()  # stats
+        yield websocket
+
+
+def assert_rejected(ws_client: TestClient, url: str):
+    """Assert the server refuses a connection to ``url`` with a policy-violation close."""
+    with pytest.raises(WebSocketDisconnect) as exc_info:
+        with ws_client.websocket_connect(url):
+            pass
+    assert exc_info.value.code == status.WS_1008_POLICY_VIOLATION
+
+
+@pytest.fixture(autouse=True)
+def _reset_connections():
+    """Put the connection registry back as the test found it, dropping anything it leaked.
+    
+    Connections opened by wider-scoped fixtures are already registered and so survive.
+    """
+    active = {user_id: list(sockets) for user_id, sockets in manager.active_connections.items()}
+    metadata = dict(manager.connection_metadata)
+    yield
+    manager.clear()
+    manager.active_connections.update(active)
+    manager.connection_metadata.update(metadata)
+
 
 class TestWebSocketConnection:
     """Test WebSocket connection functionality."""
     
     def test_websocket_connect_with_valid_token(
         self,
-        app,
-        user_token: str
+        ws_client: TestClient,
+        ws_user_token: str
     ):
         """Test WebSocket connection with valid authentication token."""
-        with TestClient(app) as client:
-            with client.websocket_connect(f"/api/v1/ws/connect?token={user_token}") as websocket:
-                # Should receive welcome message
-                data = websocket.receive_json()
-                assert data["type"] == "welcome"
-                assert "Welcome" in data["message"]
+        with ws_client.websocket_connect(f"/api/v1/ws/connect?token={ws_user_token}") as websocket:
+            # Should receive welcome message
+            data = websocket.receive_json()
+            assert data["type"] == "welcome"
+            assert "Welcome" in data["message"]
     
-    def test_websocket_connect_without_token(self, app):
+    def test_websocket_connect_without_token(self, ws_client: TestClient):
         """Test WebSocket connection without authentication token."""
-        with TestClient(app) as client:
-            with pytest.raises(Exception):  # Connection should be rejected
-                with client.websocket_connect("/api/v1/ws/connect"):
-                    pass
+        assert_rejected(ws_client, "/api/v1/ws/connect")
     
-    def test_websocket_connect_with_invalid_token(self, app):
+    def test_websocket_connect_with_invalid_token(self, ws_client: TestClient):
         """Test WebSocket connection with invalid token."""
-        with TestClient(app) as client:
-            with pytest.raises(Exception):  # Connection should be rejected
-                with client.websocket_connect("/api/v1/ws/connect?token=invalid_token"):
-                    pass
+        assert_rejected(ws_client, "/api/v1/ws/connect?token=invalid_token")
     
     def test_websocket_receives_welcome_and_stats(
         self,
-        app,
-        user_token: str
+        ws_client: TestClient,
+        ws_user_token: str
     ):
         """Test that WebSocket receives welcome message and stats on connection."""
-        with TestClient(app) as client:
-            with client.websocket_connect(f"/api/v1/ws/connect?token={user_token}") as websocket:
-                # Welcome message
-                welcome_data = websocket.receive_json()
-                assert welcome_data["type"] == "welcome"
-                
-                # Stats message
-                stats_data = websocket.receive_json()
-                assert stats_data["type"] == "stats"
-                assert "active_users" in stats_data
-                assert "total_connections" in stats_data
+        with ws_client.websocket_connect(f"/api/v1/ws/connect?token={ws_user_token}") as websocket:
+            # Welcome message
+            welcome_data = websocket.receive_json()
+            assert welcome_data["type"] == "welcome"
+            
+            # Stats message
+            stats_data = websocket.receive_json()
+            assert stats_data["type"] == "stats"
+            assert "active_users" in stats_data
+            assert "total_connections" in stats_data
 
 
-class TestWebSocketMessages:
-    """Test WebSocket message handling."""
-    
-    def test_ping_pong_message(
-        self,
-        app,
-        user_token: str
-    ):
-        """Test ping-pong message exchange."""
-        with TestClient(app) as client:
-            with client.websocket_connect(f"/api/v1/ws/connect?token={user_token}") as websocket:
-                # Skip welcome messages
-                websocket.receive_json()  # welcome
-                websocket.receive_json()  # stats
-                
-                # Send ping
-                websocket.send_json({"type": "ping"})
-                
-                # Receive pong
-                response = websocket.receive_json()
-                assert response["type"] == "pong"
-                assert "timestamp" in response
-    
-    def test_echo_message(
-        self,
-        app,
-        user_token: str
-    ):
-        """Test echo message functionality."""
-        with TestClient(app) as client:
-            with client.websocket_connect(f"/api/v1/ws/connect?token={user_token}") as websocket:
-                # Skip welcome messages
-                websocket.receive_json()  # welcome
-                websocket.receive_json()  # stats
-                
-                # Send echo message
-                test_message = "Hello, WebSocket!"
-                websocket.send_json({
-                    "type": "echo",
-                    "message": test_message
-                })
-                
-                # Receive echo response
-                response = websocket.receive_json()
-                assert response["type"] == "echo_response"
-                assert response["original_message"] == test_message
-    
-    def test_get_stats_message(
-        self,
-        app,
-        user_token: str
-    ):
-        """Test getting connection statistics."""
-        with TestClient(app) as client:
-            with client.websocket_connect(f"/api/v1/ws/connect?token={user_token}") as websocket:
-                # Skip welcome messages
-                websocket.receive_json()  # welcome
-                websocket.receive_json()  # stats
-                
-                # Request stats
-                websocket.send_json({"type": "get_stats"})
-                
-                # Receive stats response
-                response = websocket.receive_json()
-                assert response["type"] == "stats_response"
-                assert "active_users" in response
-                assert "total_connections" in response
-                assert response["active_users"] >= 1
-                assert response["total_connections"] >= 1
-    
-    def test_invalid_message_format(
-        self,
-        app,
-        user_token: str
-    ):
-        """Test handling of invalid message format."""
-        with TestClient(app) as client:
-            with client.websocket_connect(f"/api/v1/ws/connect?token={user_token}") as websocket:
-                # Skip welcome messages
-                websocket.receive_json()  # welcome
-                websocket.receive_json()  # stats
-                
-                # Send invalid message (missing type)
-                websocket.send_json({"message": "invalid"})
-                
-                # Should receive error response
-                response = websocket.receive_json()
-                assert response["type"] == "error"
-                assert "Invalid message format" in response["message"]
-    
-    def test_unknown_message_type(
-        self,
-        app,
-        user_token: str
-    ):
-        """Test handling of unknown message type."""
-        with TestClient(app) as client:
-            with client.websocket_connect(f"/api/v1/ws/connect?token={user_token}") as websocket:
-                # Skip welcome messages
-                websocket.receive_json()  # welcome
-                websocket.receive_json()  # stats
-                
-                # Send unknown message type
-                websocket.send_json({"type": "unknown_type"})
-                
-                # Should receive error response
-                response = websocket.receive_json()
-                assert response["type"] == "error"
-                assert "Unknown message type" in response["message"]
+# (message sent, expected response type, expected response fields)
+MESSAGE_CASES = [
+    pytest.param({"type": "ping"}, "pong", {}, id="ping"),
+    pytest.param(
+        {"type": "echo", "message": "Hello, WebSocket!"},
+        "echo_response",
+        {"original_message": "Hello, WebSocket!"},
+        id="echo",
+    ),
+    pytest.param({"type": "get_stats"}, "stats_response", {"your_connections": 1}, id="stats"),
+    pytest.param(
+        {"message": "invalid"}, "error", {"message": "Invalid message format"},
+        id="missing-type",
+    ),
+    pytest.param(
+        {"type": "unknown_type"}, "error", {"message": "Unknown message type: unknown_type"},
+        id="unknown-type",
+    ),
+    pytest.param(
+        {"type": "private_message", "target_user_id": 99999, "message": "Hello, nobody!"},
+        "message_sent",
+        {"target_user_id": 99999},
+        id="private-to-nonexistent-user",
+    ),
+    pytest.param(
+        {"type": "private_message", "message": "Hello!"},
+        "error",
+        {"message": "Missing target_user_id or message"},
+        id="private-missing-target",
+    ),
+    pytest.param(
+        {"type": "broadcast", "message": "This is a broadcast!"},
+        "error",
+        {"message": "Permission denied"},
+        id="broadcast-as-regular-user",
+    ),
+]
 
 
-class TestPrivateMessages:
-    """Test private messaging functionality."""
+class TestWebSocketMessages:
+    """Test single request/response WebSocket messages."""
     
-    def test_private_message_to_nonexistent_user(
-        self,
-        app,
-        user_token: str
-    ):
-        """Test sending private message to non-existent user."""
-        with TestClient(app) as client:
-            with client.websocket_connect(f"/api/v1/ws/connect?token={user_token}") as websocket:
-                # Skip welcome messages
-                websocket.receive_json()  # welcome
-                websocket.receive_json()  # stats
-                
-                # Send private message to non-existent user
-                websocket.send_json({
-                    "type": "private_message",
-                    "target_user_id": 99999,
-                    "message": "Hello, non-existent user!"
-                })
-                
-                # Should still get confirmation (message sent to void)
-                response = websocket.receive_json()
-                assert response["type"] == "message_sent"
-                assert response["target_user_id"] == 99999
+    @pytest.fixture(scope="class")
+    def connected_ws(self, ws_client: TestClient, ws_user_token: str):
+        """One open connection, past its welcome frames, shared by every case in the class."""
+        with connected(ws_client, ws_user_token) as websocket:
+            yield websocket
     
-    def test_private_message_missing_fields(
+    @pytest.mark.parametrize("message,expected_type,expected_fields", MESSAGE_CASES)
+    def test_message_roundtrip(
         self,
-        app,
-        user_token: str
+        connected_ws,
+        message: dict,
+        expected_type: str,
+        expected_fields: dict
     ):
-        """Test private message with missing required fields."""
-        with TestClient(app) as client:
-            with client.websocket_connect(f"/api/v1/ws/connect?token={user_token}") as websocket:
-                # Skip welcome messages
-                websocket.receive_json()  # welcome
-                websocket.receive_json()  # stats
-                
-                # Send private message without target_user_id
-                websocket.send_json({
-                    "type": "private_message",
-                    "message": "Hello!"
-                })
-                
-                # Should receive error
-                response = websocket.receive_json()
-                assert response["type"] == "error"
-                assert "Missing target_user_id" in response["message"]
+        """Test that each message gets the expected single response."""
+        connected_ws.send_json(message)
+        
+        response = connected_ws.receive_json()
+        assert response["type"] == expected_type
+        assert "timestamp" in response
+        for field, value in expected_fields.items():
+            assert response[field] == value
 
 
 class TestBroadcastMessages:
     """Test broadcast message functionality."""
     
-    def test_broadcast_message_as_regular_user(
-        self,
-        app,
-        user_token: str
-    ):
-        """Test that regular users cannot send broadcast messages."""
-        with TestClient(app) as client:
-            with client.websocket_connect(f"/api/v1/ws/connect?token={user_token}") as websocket:
-                # Skip welcome messages
-                websocket.receive_json()  # welcome
-                websocket.receive_json()  # stats
-                
-                # Try to send broadcast message
-                websocket.send_json({
-                    "type": "broadcast",
-                    "message": "This is a broadcast!"
-                })
-                
-                # Should receive permission denied error
-                response = websocket.receive_json()
-                assert response["type"] == "error"
-                assert "Permission denied" in response["message"]
-    
     def test_broadcast_message_as_superuser(
         self,
-        app,
-        superuser_token: str
+        ws_client: TestClient,
+        ws_superuser_token: str
     ):
         """Test that superusers can send broadcast messages."""
-        with TestClient(app) as client:
-            with client.websocket_connect(f"/api/v1/ws/connect?token={superuser_token}") as websocket:
-                # Skip welcome messages
-                websocket.receive_json()  # welcome
-                websocket.receive_json()  # stats
-                
-                # Send broadcast message
-                websocket.send_json({
-                    "type": "broadcast",
-                    "message": "Admin broadcast!"
-                })
-                
-                # Should receive the broadcast message back (since we're connected)
-                response = websocket.receive_json()
-                assert response["type"] == "broadcast_message"
-                assert response["message"] == "Admin broadcast!"
-                assert response["from_user"] is not None
+        with connected(ws_client, ws_superuser_token) as websocket:
+            # Send broadcast message
+            websocket.send_json({
+                "type": "broadcast",
+                "message": "Admin broadcast!"
+            })
+            
+            # Should receive the broadcast message back (since we're connected)
+            response = websocket.receive_json()
+            assert response["type"] == "broadcast_message"
+            assert response["message"] == "Admin broadcast!"
+            assert response["from_user"] is not None
 
 
 class TestChatRooms:
@@ -276,81 +183,68 @@ class TestChatRooms:
     
     def test_join_and_leave_room(
         self,
-        app,
-        user_token: str
+        ws_client: TestClient,
+        ws_user_token: str
     ):
         """Test joining and leaving a chat room."""
-        with TestClient(app) as client:
-            with client.websocket_connect(f"/api/v1/ws/connect?token={user_token}") as websocket:
-                # Skip welcome messages
-                websocket.receive_json()  # welcome
-                websocket.receive_json()  # stats
-                
-                # Join room
-                websocket.send_json({
-                    "type": "join_room",
-                    "room": "test_room"
-                })
-                
-                # Should receive confirmation
-                response = websocket.receive_json()
-                assert response["type"] == "room_joined"
-                assert response["room"] == "test_room"
-                
-                # Leave room
-                websocket.send_json({
-                    "type": "leave_room",
-                    "room": "test_room"
-                })
-                
-                # Should receive confirmation
-                response = websocket.receive_json()
-                assert response["type"] == "room_left"
-                assert response["room"] == "test_room"
+        with connected(ws_client, ws_user_token) as websocket:
+            # Join room
+            websocket.send_json({
+                "type": "join_room",
+                "room": "test_room"
+            })
+            
+            # Should receive confirmation
+            response = websocket.receive_json()
+            assert response["type"] == "room_joined"
+            assert response["room"] == "test_room"
+            
+            # Leave room
+            websocket.send_json({
+                "type": "leave_room",
+                "room": "test_room"
+            })
+            
+            # Should receive confirmation
+            response = websocket.receive_json()
+            assert response["type"] == "room_left"
+            assert response["room"] == "test_room"
     
     def test_room_message(
         self,
-        app,
-        user_token: str
+        ws_client: TestClient,
+        ws_user_token: str
     ):
         """Test sending message to chat room."""
-        with TestClient(app) as client:
-            with client.websocket_connect(f"/api/v1/ws/connect?token={user_token}") as websocket:
-                # Skip welcome messages
-                websocket.receive_json()  # welcome
-                websocket.receive_json()  # stats
-                
-                # Join room first
-                websocket.send_json({
-                    "type": "join_room",
-                    "room": "test_room"
-                })
-                websocket.receive_json()  # room_joined confirmation
-                
-                # Send room message
-                websocket.send_json({
-                    "type": "room_message",
-                    "room": "test_room",
-                    "message": "Hello, room!"
-                })
-                
-                # Should receive the room message back (since we're in the room)
-                response = websocket.receive_json()
-                assert response["type"] == "room_message"
-                assert response["room"] == "test_room"
-                assert response["message"] == "Hello, room!"
-                assert response["from_user_id"] is not None
+        with connected(ws_client, ws_user_token) as websocket:
+            # Join room first
+            websocket.send_json({
+                "type": "join_room",
+                "room": "test_room"
+            })
+            websocket.receive_json()  # room_joined confirmation
+            
+            # Send room message
+            websocket.send_json({
+                "type": "room_message",
+                "room": "test_room",
+                "message": "Hello, room!"
+            })
+            
+            # Should receive the room message back (since we're in the room)
+            response = websocket.receive_json()
+            assert response["type"] == "room_message"
+            assert response["room"] == "test_room"
+            assert response["message"] == "Hello, room!"
+            assert response["from_user_id"] is not None
 
 
 class TestWebSocketHealth:
     """Test WebSocket health endpoint."""
     
-    async def test_websocket_health_endpoint(
-        self,
-        client: AsyncClient
-    ):
+    def test_websocket_health_endpoint(self, ws_client: TestClient):
         """Test WebSocket health check endpoint."""
-        response = await client.get("/api/v1/ws/health")
+        response = ws_client.get("/api/v1/ws/health")
         
         assert response.status_code == 200
         data = response.json()
@@ -368,36 +262,52 @@ class TestMultipleConnections:
     
     def test_multiple_connections_same_user(
         self,
-        app,
-        user_token: str
+        ws_client: TestClient,
+        ws_user_token: str
     ):
         """Test multiple connections from same user."""
-        with TestClient(app) as client:
-            # First connection
-            with client.websocket_connect(f"/api/v1/ws/connect?token={user_token}") as ws1:
-                # Skip welcome messages
-                ws1.receive_json()  # welcome
-                stats1 = ws1.receive_json()  # stats
+        # First connection
+        with connected(ws_client, ws_user_token) as ws1:
+            # Second connection from same user
+            with connected(ws_client, ws_user_token) as ws2:
+                # The first connection is told about the second
+                notice = ws1.receive_json()
+                assert notice["type"] == "connection_established"
+                
+                # Both connections should work
+                ws1.send_json({"type": "ping"})
+                pong1 = ws1.receive_json()
+                assert pong1["type"] == "pong"
+                
+                ws2.send_json({"type": "ping"})
+                pong2 = ws2.receive_json()
+                assert pong2["type"] == "pong"
                 
-                # Second connection from same user
-                with client.websocket_connect(f"/api/v1/ws/connect?token={user_token}") as ws2:
-                    # Skip welcome messages
-                    ws2.receive_json()  # welcome
-                    stats2 = ws2.receive_json()  # stats
-                    
-                    # Both connections should work
-                    ws1.send_json({"type": "ping"})
-                    pong1 = ws1.receive_json()
-                    assert pong1["type"] == "pong"
-                    
-                    ws2.send_json({"type": "ping"})
-                    pong2 = ws2.receive_json()
-                    assert pong2["type"] == "pong"
-                    
-                    # User connection count should be 2
-                    ws1.send_json({"type": "get_stats"})
-                    final_stats = ws1.receive_json()
-                    assert final_stats["your_connections"] == 2
+                # User connection count should be 2
+                ws1.send_json({"type": "get_stats"})
+                final_stats = ws1.receive_json()
+                assert final_stats["your_connections"] == 2
+    
+    @pytest.mark.slow
+    def test_many_connections_same_user(
+        self,
+        ws_client: TestClient,
+        ws_user_token: str
+    ):
+        """Test that the manager tracks many concurrent connections from one user."""
+        num_connections = 100
+        
+        with ExitStack() as stack:
+            sockets = [
+                stack.enter_context(connected(ws_client, ws_user_token))
+                for _ in range(num_connections)
+            ]
+            
+            # Earlier sockets have connection_established notices queued; the last has none
+            sockets[-1].send_json({"type": "get_stats"})
+            stats = sockets[-1].receive_json()
+            assert stats["type"] == "stats_response"
+            assert stats["your_connections"] == num_connections
 
 
 @pytest.mark.integration
@@ -406,49 +316,43 @@ class TestWebSocketIntegration:
     
     def test_websocket_with_auth_flow(
         self,
-        app,
+        ws_client: TestClient,
         test_user: User
     ):
         """Test WebSocket connection using token from auth flow."""
-        # First, get a token through the auth API
-        with TestClient(app) as client:
-            # Login to get token
-            login_response = client.post("/api/v1/auth/login", json={
-                "email": test_user.email,
-                "password": "testpassword123"
-            })
-            
-            assert login_response.status_code == 200
-            token_data = login_response.json()
-            access_token = token_data["access_token"]
-            
-            # Use token for WebSocket connection
-            with client.websocket_connect(f"/api/v1/ws/connect?token={access_token}") as websocket:
-                # Should receive welcome message
-                welcome = websocket.receive_json()
-                assert welcome["type"] == "welcome"
-                assert str(test_user.id) in str(welcome["user_id"])
+        # First, log in through the auth API to get a token
+        login_response = ws_client.post("/api/v1/auth/login", json={
+            "email": test_user.email,
+            "password": "testpassword123"
+        })
+        
+        assert login_response.status_code == 200
+        token_data = login_response.json()
+        access_token = token_data["access_token"]
+        
+        # Use token for WebSocket connection
+        with ws_client.websocket_connect(f"/api/v1/ws/connect?token={access_token}") as websocket:
+            # Should receive welcome message
+            welcome = websocket.receive_json()
+            assert welcome["type"] == "welcome"
+            assert str(test_user.id) in str(welcome["user_id"])
     
+    @pytest.mark.parametrize(
+        "token",
+        [
+            # Expired (simulated with an obviously invalid token)
+            pytest.param("expired.token.here", id="expired"),
+            pytest.param("malformed_token", id="malformed"),
+            pytest.param("", id="empty"),
+        ],
+    )
     def test_websocket_token_validation(
         self,
-        app
+        ws_client: TestClient,
+        token: str
     ):
         """Test WebSocket token validation edge cases."""
-        with TestClient(app) as client:
-            # Test with expired token (simulate by using obviously invalid token)
-            with pytest.raises(Exception):
-                with client.websocket_connect("/api/v1/ws/connect?token=expired.token.here"):
-                    pass
-            
-            # Test with malformed token
-            with pytest.raises(Exception):
-                with client.websocket_connect("/api/v1/ws/connect?token=malformed_token"):
-                    pass
-            
-            # Test with empty token
-            with pytest.raises(Exception):
-                with client.websocket_connect("/api/v1/ws/connect?token="):
-                    pass
+        assert_rejected(ws_client, f"/api/v1/ws/connect?token={token}")
 
 
 @pytest.mark.slow
@@ -457,30 +361,37 @@ class TestWebSocketPerformance:
     
     def test_websocket_message_throughput(
         self,
-        app,
-        user_token: str,
+        ws_client: TestClient,
+        ws_user_token: str,
         performance_threshold: dict
     ):
         """Test WebSocket message handling performance."""
+        import statistics
         import time
         
-        with TestClient(app) as client:
-            with client.websocket_connect(f"/api/v1/ws/connect?token={user_token}") as websocket:
-                # Skip welcome messages
-                websocket.receive_json()  # welcome
-                websocket.receive_json()  # stats
-                
-                # Send multiple ping messages and measure response time
-                start_time = time.time()
-                num_messages = 10
-                
-                for _ in range(num_messages):
-                    websocket.send_json({"type": "ping"})
-                    response = websocket.receive_json()
-                    assert response["type"] == "pong"
-                
-                end_time = time.time()
-                avg_response_time = (end_time - start_time) / num_messages
-                
-                # Should handle messages within performance threshold
-                assert avg_response_time < performance_threshold["api_response"]
\ No newline at end of file
+        num_warmup = 20
+        num_messages = 100
+        
+        with connected(ws_client, ws_user_token) as websocket:
+            # Warm up first so one-off setup costs stay out of the measurement
+            for _ in range(num_warmup):
+                websocket.send_text(PING_FRAME)
+            for _ in range(num_warmup):
+                websocket.receive_json()
+            
+            # Pipeline the pings, then collect the pongs, so the loop measures throughput
+            # rather than one round trip per message; pongs come back in order
+            sent_at = []
+            for _ in range(num_messages):
+                sent_at.append(time.perf_counter())
+                websocket.send_text(PING_FRAME)
+            
+            latencies = []
+            for started in sent_at:
+                assert websocket.receive_json()["type"] == "pong"
+                latencies.append(time.perf_counter() - started)
+        
+        # Should handle messages within performance threshold, tail included
+        threshold = performance_threshold["api_response"]
+        assert statistics.median(latencies) < threshold
+        assert statistics.quantiles(latencies, n=100)[98] < threshold
\ No newline at end of file
@@ -0,0 +1 @@
+"""Unit tests that need no app, database or Redis."""
@@ -0,0 +1,13 @@
+"""
+Configuration for the unit tests.
+
+Run them alone with ``pytest --confcutdir=tests/unit tests/unit`` so the app
+conftest in ``tests/`` is never imported.
+"""
+
+
+def pytest_configure(config):
+    """Register the marker the unit tests carry."""
+    config.addinivalue_line(
+        "markers", "cpu: pure unit test with no app, database or Redis"
+    )
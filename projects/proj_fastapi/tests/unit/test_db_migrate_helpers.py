@@ -0,0 +1,112 @@
+"""Data migration helper tests."""
+
+import pytest
+from alembic.migration import MigrationContext
+from sqlalchemy import Column, Integer, MetaData, String, Table, create_engine, func, select
+
+from app.core.db_migrate_helpers import batch_commit, paginated
+
+pytestmark = pytest.mark.cpu
+
+metadata = MetaData()
+items = Table(
+    "items",
+    metadata,
+    Column("id", Integer, primary_key=True),
+    Column("name", String(20)),
+)
+
+
+@pytest.fixture
+def engine(tmp_path):
+    """File-backed SQLite engine, so a second connection sees what the first committed."""
+    engine = create_engine(f"sqlite:///{tmp_path / 'migrate.db'}")
+    metadata.create_all(engine)
+    yield engine
+    engine.dispose()
+
+
+def seed(engine, count: int):
+    if count:
+        with engine.begin() as conn:
+            conn.execute(items.insert(), [{"id": i, "name": "old"} for i in range(1, count + 1)])
+
+
+def migration_context(conn) -> MigrationContext:
+    """Migration context that runs in a transaction, as on PostgreSQL."""
+    return MigrationContext.configure(conn, opts={"transactional_ddl": True})
+
+
+class TestPaginated:
+    """Test keyset paging."""
+    
+    @pytest.mark.parametrize(
+        "count,expected_sizes",
+        [(25, [10, 10, 5]), (20, [10, 10]), (3, [3]), (0, [])],
+    )
+    def test_pages(self, engine, count: int, expected_sizes: list):
+        """Test that pages cover every row once, in key order, with no trailing empty page."""
+        seed(engine, count)
+        
+        with engine.connect() as conn:
+            pages = list(paginated(conn, select(items.c.id), items.c.id, 10))
+        
+        assert [len(page) for page in pages] == expected_sizes
+        assert [row.id for page in pages for row in page] == list(range(1, count + 1))
+    
+    def test_keeps_query_filter(self, engine):
+        """Test that the caller's WHERE clause applies to every page."""
+        seed(engine, 30)
+        
+        query = select(items.c.id).where(items.c.id % 2 == 0)
+        with engine.connect() as conn:
+            ids = [row.id for page in paginated(conn, query, items.c.id, 4) for row in page]
+        
+        assert ids == list(range(2, 31, 2))
+    
+    def test_pages_are_fetched_before_yield(self, engine):
+        """Test that each page is a plain list, not a live cursor."""
+        seed(engine, 5)
+        
+        with engine.connect() as conn:
+            page = next(paginated(conn, select(items.c.id), items.c.id, 2))
+        
+        assert isinstance(page, list)
+
+
+class TestBatchCommit:
+    """Test committing pages outside the migration transaction."""
+    
+    def test_batch_is_committed(self, engine):
+        """Test that writes inside the block are visible to another connection right away."""
+        seed(engine, 1)
+        
+        with engine.connect() as conn:
+            ctx = migration_context(conn)
+            with ctx.begin_transaction():
+                with batch_commit(ctx):
+                    conn.execute(items.update().values(name="new"))
+                
+                with engine.connect() as other:
+                    assert other.execute(select(items.c.name)).scalar_one() == "new"
+    
+    def test_backfill_commits_between_pages(self, engine):
+        """Test the documented recipe: commit each page while paging through the table."""
+        seed(engine, 25)
+        
+        with engine.connect() as conn:
+            ctx = migration_context(conn)
+            with ctx.begin_transaction():
+                for rows in paginated(conn, select(items.c.id), items.c.id, 10):
+                    with batch_commit(ctx):
+                        conn.execute(
+                            items.update()
+                            .where(items.c.id.in_([row.id for row in rows]))
+                            .values(name="new")
+                        )
+        
+        with engine.connect() as conn:
+            remaining = conn.execute(
+                select(func.count()).select_from(items).where(items.c.name != "new")
+            ).scalar_one()
+        assert remaining == 0
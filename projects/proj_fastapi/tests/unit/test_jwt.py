@@ -0,0 +1,151 @@
+"""JWT token manager tests."""
+
+from types import SimpleNamespace
+
+import pytest
+
+from app.core import auth
+from app.core.auth import JWTTokenManager, jwt_manager
+
+pytestmark = pytest.mark.cpu
+
+# Token tests only need an id and email, not a database row
+JWT_TEST_USER = SimpleNamespace(id=1, email="jwt@test.com")
+
+
+class TestJWTTokenManager:
+    """Test JWT token manager functionality."""
+    
+    def test_create_access_token(self):
+        """Test access token creation."""
+        data = {"sub": str(JWT_TEST_USER.id), "email": JWT_TEST_USER.email}
+        token = jwt_manager.create_access_token(data)
+        
+        assert isinstance(token, str)
+        assert len(token) > 0
+        
+        # Verify token
+        payload = jwt_manager.verify_token(token)
+        assert payload is not None
+        assert payload["sub"] == str(JWT_TEST_USER.id)
+        assert payload["type"] == "access"
+    
+    def test_create_refresh_token(self):
+        """Test refresh token creation."""
+        data = {"sub": str(JWT_TEST_USER.id)}
+        token = jwt_manager.create_refresh_token(data)
+        
+        assert isinstance(token, str)
+        assert len(token) > 0
+        
+        # Verify token
+        payload = jwt_manager.verify_token(token)
+        assert payload is not None
+        assert payload["sub"] == str(JWT_TEST_USER.id)
+        assert payload["type"] == "refresh"
+    
+    def test_verify_invalid_token(self):
+        """Test verifying invalid token."""
+        payload = jwt_manager.verify_token("invalid_token")
+        assert payload is None
+    
+    def test_create_password_reset_token(self):
+        """Test password reset token creation."""
+        token = jwt_manager.create_password_reset_token(JWT_TEST_USER.email)
+        
+        assert isinstance(token, str)
+        assert len(token) > 0
+        
+        # Verify token
+        email = jwt_manager.verify_password_reset_token(token)
+        assert email == JWT_TEST_USER.email
+
+
+class TestVerifyTokenCache:
+    """Test the verified-payload cache in JWTTokenManager.verify_token."""
+    
+    @pytest.fixture
+    def clock(self, monkeypatch):
+        """Controllable clock for the cache's time checks."""
+        now = [1_000.0]
+        monkeypatch.setattr(auth.time, "time", lambda: now[0])
+        return now
+    
+    @pytest.fixture
+    def manager(self, monkeypatch):
+        """Fresh manager whose decode step is counted and returns a fixed payload."""
+        manager = JWTTokenManager()
+        manager.decoded = []
+        
+        def decode(token):
+            manager.decoded.append(token)
+            if token == "bad":
+                return None
+            return {"sub": token, "exp": 1_000.0 + 3_600}
+        
+        monkeypatch.setattr(manager, "_decode_token", decode)
+        return manager
+    
+    def test_second_verify_is_cache_hit(self, manager, clock):
+        """Test that a repeated token is decoded once."""
+        first = manager.verify_token("tok")
+        second = manager.verify_token("tok")
+        
+        assert first == second == {"sub": "tok", "exp": 4_600.0}
+        assert manager.decoded == ["tok"]
+    
+    def test_cache_hit_returns_copy(self, manager, clock):
+        """Test that mutating a returned payload does not change the cached one."""
+        payload = manager.verify_token("tok")
+        payload["sub"] = "someone-else"
+        payload["is_superuser"] = True
+        
+        assert manager.verify_token("tok") == {"sub": "tok", "exp": 4_600.0}
+    
+    def test_entry_expires_after_ttl(self, manager, clock):
+        """Test that an entry is re-decoded once the cache TTL has passed."""
+        manager.verify_token("tok")
+        
+        clock[0] += manager.verify_cache_ttl - 1
+        manager.verify_token("tok")
+        assert manager.decoded == ["tok"]
+        
+        clock[0] += 1
+        manager.verify_token("tok")
+        assert manager.decoded == ["tok", "tok"]
+    
+    def test_entry_expires_with_token(self, manager, clock, monkeypatch):
+        """Test that an entry never outlives the token's own exp, even within the TTL."""
+        monkeypatch.setattr(
+            manager, "_decode_token", lambda token: {"sub": token, "exp": clock[0] + 5}
+        )
+        manager.verify_token("tok")
+        key, (cached_until, _) = next(iter(manager._verified.items()))
+        assert cached_until == clock[0] + 5
+        
+        clock[0] += 5
+        monkeypatch.setattr(manager, "_decode_token", lambda token: None)
+        assert manager.verify_token("tok") is None
+        assert key not in manager._verified
+    
+    def test_failed_decode_is_not_cached(self, manager, clock):
+        """Test that an invalid token is decoded again on every call."""
+        assert manager.verify_token("bad") is None
+        assert manager.verify_token("bad") is None
+        
+        assert manager.decoded == ["bad", "bad"]
+        assert manager._verified == {}
+    
+    def test_eviction_at_cache_size(self, manager, clock):
+        """Test that the oldest entry is evicted once verify_cache_size is reached."""
+        manager.verify_cache_size = 3
+        for token in ("a", "b", "c"):
+            manager.verify_token(token)
+        assert len(manager._verified) == 3
+        
+        manager.verify_token("d")
+        assert len(manager._verified) == 3
+        
+        manager.verify_token("b")
+        manager.verify_token("a")
+        assert manager.decoded == ["a", "b", "c", "d", "a"]
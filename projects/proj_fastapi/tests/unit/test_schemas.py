@@ -0,0 +1,126 @@
+"""Schema field type tests."""
+
+import pytest
+from pydantic import TypeAdapter, ValidationError
+
+from app.schemas._examples import SCHEMA_DESCRIPTIONS, SCHEMA_EXAMPLES, apply_examples
+from app.schemas._types import FastEmail
+from app.schemas.user import UserListResponse
+
+pytestmark = pytest.mark.cpu
+
+email_adapter = TypeAdapter(FastEmail)
+
+
+class TestFastEmail:
+    """Test the regex-free email field type."""
+    
+    @pytest.mark.parametrize(
+        "value,expected",
+        [
+            ("user@example.com", "user@example.com"),
+            ("first.last+tag@mail.example.co.uk", "first.last+tag@mail.example.co.uk"),
+            ("User@EXAMPLE.COM", "User@example.com"),
+            ("a@b-c.io", "a@b-c.io"),
+            ("o'brien@x1.example", "o'brien@x1.example"),
+            ("a@" + "d" * 63 + ".com", "a@" + "d" * 63 + ".com"),
+        ],
+    )
+    def test_valid(self, value: str, expected: str):
+        """Test that valid addresses pass, with only the domain lowercased."""
+        assert email_adapter.validate_python(value) == expected
+    
+    @pytest.mark.parametrize(
+        "value",
+        [
+            "",
+            "plainaddress",
+            "@example.com",
+            "user@",
+            "user@@example.com",
+            "a@b@example.com",
+            "user@localhost",
+            ".user@example.com",
+            "user.@example.com",
+            "us..er@example.com",
+            "us er@example.com",
+            "user@example..com",
+            "user@.example.com",
+            "user@example.com.",
+            "user@-example.com",
+            "user@example-.com",
+            "a@b-.com",
+            "user@sub.-x.com",
+            "user@example.-com",
+            "user@exa_mple.com",
+            "üser@example.com",
+            "a@" + "d" * 64 + ".com",
+            "a" * 65 + "@example.com",
+            "a@" + "d" * 250 + ".com",
+        ],
+    )
+    def test_invalid(self, value: str):
+        """Test that malformed addresses are rejected."""
+        with pytest.raises(ValidationError):
+            email_adapter.validate_python(value)
+
+
+class TestUserListResponse:
+    """Test the paginated user list schema."""
+    
+    @pytest.mark.parametrize("total,size,pages", [(0, 10, 0), (10, 10, 1), (11, 10, 2), (3, 1, 3)])
+    def test_pages(self, total: int, size: int, pages: int):
+        """Test that pages rounds up."""
+        response = UserListResponse(users=[], total=total, page=1, size=size)
+        assert response.pages == pages
+    
+    def test_rejects_zero_size(self):
+        """Test that a zero page size is rejected instead of failing in pages."""
+        with pytest.raises(ValidationError):
+            UserListResponse(users=[], total=5, page=1, size=0)
+
+
+def openapi_document(**schemas: dict) -> dict:
+    """Minimal OpenAPI document carrying the given component schemas."""
+    return {"components": {"schemas": schemas}}
+
+
+def documented_schemas() -> dict:
+    """Component schemas for every name in the example tables, with every described field."""
+    return {
+        name: {"properties": {field: {} for field in SCHEMA_DESCRIPTIONS.get(name, {})}}
+        for name in SCHEMA_EXAMPLES.keys() | SCHEMA_DESCRIPTIONS.keys()
+    }
+
+
+class TestApplyExamples:
+    """Test attaching examples and descriptions to an OpenAPI document."""
+    
+    def test_attaches_to_input_and_output_schemas(self):
+        """Test that split -Input/-Output schemas both get the example and descriptions."""
+        schemas = documented_schemas()
+        user_response = schemas.pop("UserResponse")
+        schemas["UserResponse-Input"] = user_response
+        schemas["UserResponse-Output"] = {"properties": dict(user_response["properties"])}
+        
+        components = apply_examples(openapi_document(**schemas))["components"]["schemas"]
+        
+        for name in ("UserResponse-Input", "UserResponse-Output"):
+            assert components[name]["example"] == SCHEMA_EXAMPLES["UserResponse"]
+            assert components[name]["properties"]["id"]["description"] == "User ID"
+    
+    def test_rejects_missing_schema(self):
+        """Test that a schema the document lacks is an error, not a silent no-op."""
+        schemas = documented_schemas()
+        del schemas["LoginRequest"]
+        
+        with pytest.raises(ValueError, match="LoginRequest"):
+            apply_examples(openapi_document(**schemas))
+    
+    def test_rejects_missing_field(self):
+        """Test that a described field the schema lacks is an error."""
+        schemas = documented_schemas()
+        del schemas["LoginRequest"]["properties"]["password"]
+        
+        with pytest.raises(ValueError, match="password"):
+            apply_examples(openapi_document(**schemas))
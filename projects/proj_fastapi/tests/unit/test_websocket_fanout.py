@@ -0,0 +1,45 @@
+"""WebSocket fan-out tests against the connection manager alone."""
+
+import orjson
+import pytest
+
+from app.api.websocket import ConnectionManager
+
+pytestmark = pytest.mark.cpu
+
+
+class RecordingWebSocket:
+    """Stand-in connection that records the text frames sent to it."""
+    
+    def __init__(self):
+        self.frames = []
+    
+    async def send_text(self, frame: str):
+        self.frames.append(frame)
+
+
+class TestBroadcastFanout:
+    """Test that fan-out encodes a message once for every recipient."""
+    
+    async def test_broadcast_sends_one_encoded_frame(self):
+        """Test that every connection receives the same frame object."""
+        fanout = ConnectionManager()
+        sockets = [RecordingWebSocket() for _ in range(3)]
+        fanout.active_connections = {1: sockets[:2], 2: sockets[2:]}
+        
+        await fanout.broadcast_to_all({"type": "broadcast_message", "message": "Hi!"})
+        
+        frame = sockets[0].frames[0]
+        assert orjson.loads(frame) == {"type": "broadcast_message", "message": "Hi!"}
+        assert all(len(ws.frames) == 1 and ws.frames[0] is frame for ws in sockets)
+    
+    async def test_broadcast_skips_excluded_users(self):
+        """Test that excluded users get nothing."""
+        fanout = ConnectionManager()
+        included, excluded = RecordingWebSocket(), RecordingWebSocket()
+        fanout.active_connections = {1: [included], 2: [excluded]}
+        
+        await fanout.broadcast_to_all({"type": "broadcast_message"}, exclude_users={2})
+        
+        assert len(included.frames) == 1
+        assert excluded.frames == []